@@ -13,6 +13,7 @@ Contract v1.2: Added capability intelligence hints (aliases, freshness, tiers).
 
 from __future__ import annotations
 
+import sys
 from enum import StrEnum
 from typing import Any
 
@@ -160,17 +161,11 @@ class SearchCapabilities(BaseModel):
     @field_validator("alias_hints")
     @classmethod
     def _validate_alias_hints(cls, value: list[str]) -> list[str]:
-        normalized: list[str] = []
-        seen: set[str] = set()
-        for raw in value:
-            alias = str(raw).strip().lower()
-            if not alias:
-                raise ValueError("alias_hints must not contain empty values")
-            if alias in seen:
-                continue
-            seen.add(alias)
-            normalized.append(alias)
-        return normalized
+        cleaned = [str(raw).strip().lower() for raw in value]
+        if not all(cleaned):
+            raise ValueError("alias_hints must not contain empty values")
+        # dict.fromkeys dedupes while keeping first-seen order.
+        return list(dict.fromkeys(cleaned))
 
 
 # ---------------------------------------------------------------------------
@@ -228,6 +223,17 @@ class UnifiedSearchRequest(BaseModel):
 # ---------------------------------------------------------------------------
 
 
+# Per-method weights for SearchResultV1.final_score; unknown methods get the default.
+# Keys are interned, as are decoded score keys, so lookups hit the identity check.
+_FINAL_SCORE_WEIGHTS: dict[str, float] = {
+    sys.intern(RetrievalMethod.STRUCTURED.value): 1.0,
+    sys.intern(RetrievalMethod.FULLTEXT.value): 0.85,
+    sys.intern(RetrievalMethod.VECTOR.value): 0.7,
+    sys.intern(RetrievalMethod.GRAPH.value): 0.9,
+}
+_DEFAULT_FINAL_SCORE_WEIGHT = 0.5
+
+
 class SearchResultV1(BaseModel):
     """One search result, with per-method scores and provenance."""
 
@@ -251,21 +257,25 @@ class SearchResultV1(BaseModel):
         description="Human-readable origin, e.g. 'email from john@example.com on 2026-01-15'",
     )
 
+    @field_validator("scores")
+    @classmethod
+    def _intern_score_keys(cls, value: dict[str, float]) -> dict[str, float]:
+        return {sys.intern(method): score for method, score in value.items()}
+
+    @classmethod
+    def unchecked(cls, **fields: Any) -> SearchResultV1:
+        """Build from already-validated fields (e.g. when merging results) without re-validating."""
+        return cls.model_construct(**fields)
+
     @property
     def final_score(self) -> float:
         """Weighted aggregate score across all methods."""
         if not self.scores:
             return 0.0
-        weights: dict[str, float] = {
-            RetrievalMethod.STRUCTURED.value: 1.0,
-            RetrievalMethod.FULLTEXT.value: 0.85,
-            RetrievalMethod.VECTOR.value: 0.7,
-            RetrievalMethod.GRAPH.value: 0.9,
-        }
         total_weight = 0.0
         total_score = 0.0
         for method, score in self.scores.items():
-            w = weights.get(method, 0.5)
+            w = _FINAL_SCORE_WEIGHTS.get(method, _DEFAULT_FINAL_SCORE_WEIGHT)
             total_weight += w
             total_score += score * w
         return total_score / total_weight if total_weight > 0 else 0.0
@@ -285,6 +295,11 @@ class AggregateGroup(BaseModel):
         description="Extra fields (e.g. contact_push_name, from_email)",
     )
 
+    @classmethod
+    def unchecked(cls, **fields: Any) -> AggregateGroup:
+        """Build from already-validated fields without re-validating."""
+        return cls.model_construct(**fields)
+
 
 class UnifiedSearchResponse(BaseModel):
     """Returned by each MCP server's unified_search tool."""
@@ -312,3 +327,11 @@ class UnifiedSearchResponse(BaseModel):
         description="Per-method execution time in ms",
     )
     error: str | None = Field(default=None)
+
+    @classmethod
+    def unchecked(cls, **fields: Any) -> UnifiedSearchResponse:
+        """Build from already-validated fields without re-validating.
+
+        Use model_validate only at the MCP response boundary.
+        """
+        return cls.model_construct(**fields)
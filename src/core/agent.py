@@ -2,9 +2,13 @@
 
 import asyncio
 import re
+from collections import OrderedDict, deque
 from collections.abc import Awaitable, Callable
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, tzinfo
+from functools import lru_cache
+from itertools import islice
 from zoneinfo import ZoneInfo
 
 from src.core.bootstrap import save_system_prompt_for_debug, setup_tools
@@ -12,6 +16,7 @@ from src.core.config import config
 from src.core.logger import logger
 from src.core.prompts import fill_date_context
 from src.core.tool_call import (
+    ToolCall,
     get_tool_arguments,
     get_tool_name,
     parse_legacy_tool_call,
@@ -20,19 +25,187 @@ from src.core.tool_call import (
 from src.core.worker import current_llm_client
 from src.llm.vllm_client import VLLMClient, create_client
 from src.observability import trace
-from src.tools.base import ToolRegistry, ToolResult, parse_pending_confirm
-
-
-@dataclass
+from src.tools.base import Tool, ToolRegistry, ToolResult, parse_pending_confirm
+
+_THOUGHT_OPEN_RE = re.compile(r"<(think|thought)>")
+_THOUGHT_CLOSE_RE = re.compile(r"</(think|thought)>")
+# Any thought marker: an opening tag or a "Thought:" prefix, found in one scan.
+_THOUGHT_MARKER_RE = re.compile(r"<think>|<thought>|Thought:")
+# Re-scan this many already-seen chars so a marker split across chunks is found.
+_THOUGHT_TAG_OVERLAP = len("</thought>") - 1
+
+
+def _find_thought_block(text: str) -> tuple[int, int, int, int] | None:
+    """Locate the first <think>/<thought> block closed by its own tag.
+
+    Returns (open_start, body_start, body_end, close_end) indices, or None.
+    """
+    unclosed: set[str] = set()
+    pos = 0
+    while (match := _THOUGHT_OPEN_RE.search(text, pos)) is not None:
+        tag = match.group(1)
+        if tag not in unclosed:
+            close_tag = f"</{tag}>"
+            body_end = text.find(close_tag, match.end())
+            if body_end != -1:
+                return match.start(), match.end(), body_end, body_end + len(close_tag)
+            unclosed.add(tag)
+        pos = match.end()
+    return None
+
+
+def _advance_thought_state(
+    response_text: str,
+    scan_offset: int,
+    is_thinking: bool,
+    thought_tag_found: bool,
+    thought_start: int,
+) -> tuple[bool, bool, int, str | None]:
+    """Advance the streaming thought-marker state machine over new text.
+
+    scan_offset is how much of response_text was already scanned for thought
+    markers; only the new text (plus a marker-sized overlap) is scanned again.
+    thought_start is where the thought body begins once its marker is found
+    (-1 before that); the character before it is ">" for <think>/<thought>
+    tags and ":" for a "Thought:" prefix.
+
+    Returns (is_thinking, thought_tag_found, thought_start, thought), where
+    thought is the thought text so far, or None when not inside a thought.
+    """
+    if not is_thinking and thought_tag_found:
+        return is_thinking, thought_tag_found, thought_start, None
+    scan_from = max(0, scan_offset - _THOUGHT_TAG_OVERLAP)
+
+    if not thought_tag_found:
+        if not _THOUGHT_MARKER_RE.search(response_text, scan_from):
+            return is_thinking, thought_tag_found, thought_start, None
+        is_thinking = True
+        thought_tag_found = True
+
+    if thought_start < 0 or response_text[thought_start - 1] != ">":
+        # A tag still takes over from a "Thought:" prefix, but only new text can
+        # hold one.
+        match = _THOUGHT_OPEN_RE.search(
+            response_text, 0 if thought_start < 0 else scan_from
+        )
+        if match:
+            thought_start = match.end()
+    if thought_start >= 0 and response_text[thought_start - 1] == ">":
+        close = _THOUGHT_CLOSE_RE.search(response_text, max(thought_start, scan_from))
+        thought = response_text[thought_start : close.start() if close else None]
+        return close is None, thought_tag_found, thought_start, thought.strip()
+
+    if thought_start < 0:
+        thought_start = response_text.find("Thought:") + len("Thought:")
+    end = response_text.find("\n\n", max(thought_start, scan_from))
+    thought = response_text[thought_start : end if end != -1 else None]
+    return end == -1, thought_tag_found, thought_start, thought
+
+
+_PLAN_CACHE_SIZE = 64
+# Undelivered stream events allowed before the producer waits for the consumer.
+_STREAM_EVENTS_MAX_PENDING = 64
+# Responses longer than this are parsed in a worker thread, off the event loop.
+_OFFLOAD_PARSE_CHARS = 8192
+
+
+async def _parse_response_text[T](
+    parse: Callable[..., T], text: str, *args: object
+) -> T:
+    """Run parse(text, *args) inline, or via asyncio.to_thread for large text."""
+    if len(text) > _OFFLOAD_PARSE_CHARS:
+        return await asyncio.to_thread(parse, text, *args)
+    return parse(text, *args)
+
+
+def _plan_cache_key(user_input: str) -> str:
+    return " ".join(user_input.lower().split())
+
+
+def _split_tool_closers(
+    tools: list[Tool],
+) -> tuple[list[Callable[[], object]], list[Callable[[], Awaitable[object]]]]:
+    """(sync, async) close() methods of the tools that have one, sorted once at startup."""
+    sync_closers: list[Callable[[], object]] = []
+    async_closers: list[Callable[[], Awaitable[object]]] = []
+    for tool in tools:
+        close = getattr(tool, "close", None)
+        if close is None:
+            continue
+        if asyncio.iscoroutinefunction(close):
+            async_closers.append(close)
+        else:
+            sync_closers.append(close)
+    return sync_closers, async_closers
+
+
+@lru_cache(maxsize=8)
+def _resolve_timezone(tz_name: str) -> tuple[tzinfo, str]:
+    """ZoneInfo for tz_name (UTC if unknown), cached so the tz database is read once."""
+    try:
+        return ZoneInfo(tz_name), tz_name
+    except Exception:
+        return UTC, "UTC"
+
+
+class _BackgroundEvents:
+    """on_event wrapper that delivers from a background task while streaming.
+
+    A slow consumer no longer stalls the token reader. Consecutive thought
+    updates are coalesced to the latest; once _STREAM_EVENTS_MAX_PENDING events
+    are queued the producer waits for delivery. drain() waits for delivery and
+    re-raises any consumer error; cancel() drops whatever is still queued.
+    """
+
+    def __init__(self, on_event: Callable):
+        self._on_event = on_event
+        self._pending: deque[tuple[str, object]] = deque()
+        self._task: asyncio.Task | None = None
+
+    async def __call__(self, event_type: str, data: object) -> None:
+        if (
+            event_type == "thought"
+            and self._pending
+            and self._pending[-1][0] == "thought"
+        ):
+            self._pending[-1] = (event_type, data)
+        else:
+            self._pending.append((event_type, data))
+        if self._task is None or self._task.done():
+            if self._task is not None:
+                self._task.result()
+            self._task = asyncio.create_task(self._deliver())
+        if len(self._pending) >= _STREAM_EVENTS_MAX_PENDING:
+            await self.drain()
+
+    async def _deliver(self) -> None:
+        while self._pending:
+            event_type, data = self._pending.popleft()
+            await self._on_event(event_type, data)
+
+    async def drain(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            await task
+
+    def cancel(self) -> None:
+        self._pending.clear()
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+
+
+@dataclass(slots=True, frozen=True)
 class ChatResult:
     response: str
     pending_confirm: dict | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Message:
     role: str
     content: str
+    is_tool_result: bool = False
 
 
 @dataclass
@@ -40,13 +213,27 @@ class Agent:
     llm_client: VLLMClient
     system_prompt: str
     tool_registry: ToolRegistry
-    conversation: list[Message] = field(default_factory=list)
+    conversation: deque[Message] = field(default_factory=deque)
+    # Formatter-ready {"role", "content"} dicts, kept in lockstep with conversation.
+    _history_dicts: deque[dict[str, str]] = field(default_factory=deque, repr=False)
     max_history: int = 20
     _pending_confirm: dict | None = field(default=None, repr=False)
+    # Last successful universal_search result of the current turn; reset per turn.
     _last_search_result: str | None = field(default=None, repr=False)
-    _last_search_user_msg: str | None = field(default=None, repr=False)
-    _last_search_context: str | None = field(default=None, repr=False)
     closable_resources: list[object] = field(default_factory=list, repr=False)
+    _sync_tool_closers: list[Callable[[], object]] = field(
+        default_factory=list, repr=False
+    )
+    _async_tool_closers: list[Callable[[], Awaitable[object]]] = field(
+        default_factory=list, repr=False
+    )
+    fast_llm_client: VLLMClient | None = field(default=None, repr=False)
+    # Normalized user message -> tool names the turn called, most recent last.
+    _plan_cache: OrderedDict[str, tuple[str, ...]] = field(
+        default_factory=OrderedDict, repr=False
+    )
+    _system_message_key: tuple[str, str] | None = field(default=None, repr=False)
+    _system_message: str = field(default="", repr=False)
 
     @classmethod
     async def create(cls) -> "Agent":
@@ -55,8 +242,17 @@ class Agent:
             raise FileNotFoundError("; ".join(errors))
 
         tool_registry, closables = await setup_tools()
-        system_prompt = save_system_prompt_for_debug(tool_registry)
+        # Prompt files are read and the debug copy written off the event loop.
+        system_prompt = await asyncio.to_thread(
+            save_system_prompt_for_debug, tool_registry
+        )
         llm_client = create_client()
+        fast_llm_client = (
+            create_client(config.vllm_fast_model) if config.vllm_fast_model else None
+        )
+        sync_tool_closers, async_tool_closers = _split_tool_closers(
+            tool_registry.list_tools()
+        )
 
         logger.info("Lilith Agent initialized!")
 
@@ -65,6 +261,9 @@ class Agent:
             system_prompt=system_prompt,
             tool_registry=tool_registry,
             closable_resources=closables,
+            fast_llm_client=fast_llm_client,
+            _sync_tool_closers=sync_tool_closers,
+            _async_tool_closers=async_tool_closers,
         )
 
     async def chat(
@@ -87,60 +286,53 @@ class Agent:
         full_thought: str,
         is_thinking: bool,
         thought_tag_found: bool,
+        scan_offset: int,
+        thought_start: int,
         on_event: Callable | None,
-    ) -> tuple[str, str, bool, bool]:
-        response_text = response_text + chunk
+    ) -> tuple[str, str, bool, bool, int, int]:
+        """Append a streamed chunk and emit thought updates.
 
-        if not thought_tag_found:
-            if (
-                "<think>" in response_text
-                or "<thought>" in response_text
-                or "Thought:" in response_text
-            ):
-                is_thinking = True
-                thought_tag_found = True
-
-        if is_thinking:
-            match = re.search(r"<(think|thought)>(.*?)$", response_text, re.DOTALL)
-            if match:
-                raw = match.group(2)
-                for close_tag in ("</think>", "</thought>"):
-                    if close_tag in raw:
-                        raw = raw.split(close_tag)[0]
-                new_thought = raw.strip()
-                if new_thought != full_thought:
-                    full_thought = new_thought
-                    if on_event is not None:
-                        await on_event("thought", full_thought)
-                if "</think>" in response_text or "</thought>" in response_text:
-                    is_thinking = False
-            elif "Thought:" in response_text:
-                parts = response_text.split("Thought:", 1)
-                new_thought = parts[1]
-                if "\n\n" in new_thought:
-                    new_thought = new_thought.split("\n\n")[0]
-                    is_thinking = False
-                if new_thought != full_thought:
-                    full_thought = new_thought
-                    if on_event is not None:
-                        await on_event("thought", full_thought)
-
-        return response_text, full_thought, is_thinking, thought_tag_found
+        See _advance_thought_state for scan_offset and thought_start.
+        """
+        response_text = response_text + chunk
+        is_thinking, thought_tag_found, thought_start, new_thought = (
+            _advance_thought_state(
+                response_text,
+                scan_offset,
+                is_thinking,
+                thought_tag_found,
+                thought_start,
+            )
+        )
+        if new_thought is not None and new_thought != full_thought:
+            full_thought = new_thought
+            if on_event is not None:
+                await on_event("thought", full_thought)
+
+        return (
+            response_text,
+            full_thought,
+            is_thinking,
+            thought_tag_found,
+            len(response_text),
+            thought_start,
+        )
 
     def _finalize_stream_response(self, response_text: str) -> tuple[str, str]:
         full_thought = ""
         clean_response = response_text.strip()
-        thought_match = re.search(
-            r"<(think|thought)>(.*?)</\1>", response_text, re.DOTALL
-        )
-        if thought_match:
-            full_thought = thought_match.group(2).strip()
-            clean_response = response_text.replace(thought_match.group(0), "").strip()
+        block = _find_thought_block(response_text)
+        if block is not None:
+            open_start, body_start, body_end, close_end = block
+            full_thought = response_text[body_start:body_end].strip()
+            clean_response = (
+                response_text[:open_start] + response_text[close_end:]
+            ).strip()
         elif "Thought:" in response_text:
-            before_thought, after_thought = response_text.split("Thought:", 1)
-            after_parts = after_thought.split("\n\n", 1)
-            full_thought = after_parts[0].strip()
-            response_after = after_parts[1].strip() if len(after_parts) > 1 else ""
+            before_thought, _, after_thought = response_text.partition("Thought:")
+            thought_text, _, response_after = after_thought.partition("\n\n")
+            full_thought = thought_text.strip()
+            response_after = response_after.strip()
             before_stripped = before_thought.strip()
             clean_response = (
                 (before_stripped + "\n\n" + response_after).strip()
@@ -149,20 +341,61 @@ class Agent:
             )
         return full_thought, clean_response
 
+    def _parse_streamed_tool_call(
+        self, response_text: str, valid_tool_names: AbstractSet[str]
+    ) -> tuple[str, str, ToolCall, int] | None:
+        """(thought, clean_response, tool_call, json_end) if the text so far holds a tool call."""
+        full_thought, clean_response = self._finalize_stream_response(response_text)
+        parsed, json_end = parse_tool_call_from_response(
+            clean_response, valid_tool_names
+        )
+        if parsed is None or json_end < 0:
+            return None
+        return full_thought, clean_response, parsed, json_end
+
     async def _chat_impl(
         self, user_input: str, on_event: Callable | None, client
     ) -> ChatResult:
         if user_input:
-            logger.user_input(user_input)
-            self.conversation.append(Message(role="user", content=user_input))
+            self._start_user_turn(user_input)
             if on_event is not None:
                 await on_event("user_input", user_input)
 
         self._trim_history()
 
+        # Follow-up turns after a tool result, and the planning turn of a message
+        # whose tool sequence is cached, go to the fast model when one is
+        # configured, unless the caller overrode the client for this chat.
+        fast_client = self.fast_llm_client if client is self.llm_client else None
+        # A cached plan only changes which model plans the turn, so without a
+        # fast client there is nothing to look up or remember.
+        plan_key = (
+            _plan_cache_key(user_input)
+            if config.agent_plan_cache_enabled
+            and user_input
+            and fast_client is not None
+            else None
+        )
+        cached_plan = self._plan_cache.get(plan_key) if plan_key else None
+        if plan_key and on_event is not None:
+            await on_event(
+                "plan_cache",
+                {"hit": cached_plan is not None, "tools": list(cached_plan or ())},
+            )
+        tools_called: list[str] = []
+
+        valid_tool_names = self.tool_registry.names()
+        stop_tokens = client.formatter.stop_tokens
+        fast_stop_tokens = (
+            fast_client.formatter.stop_tokens if fast_client is not None else None
+        )
         max_iterations = config.agent_max_iterations
         for iteration in range(max_iterations):
-            prompt = self._build_prompt(client)
+            if fast_client is not None and (iteration > 0 or cached_plan):
+                iteration_client, iteration_stop = fast_client, fast_stop_tokens
+            else:
+                iteration_client, iteration_stop = client, stop_tokens
+            prompt = self._build_prompt(iteration_client)
             logger.context_built(
                 token_count=len(prompt) // 4, message_count=len(self.conversation)
             )
@@ -170,47 +403,84 @@ class Agent:
             full_thought = ""
             is_thinking = False
             thought_tag_found = False
+            scan_offset = 0
+            thought_start = -1
 
             logger.set_prompt_role("main_agent")
-            generator = await client.generate(
+            generator = await iteration_client.generate(
                 prompt=prompt,
                 max_tokens=2048,
                 temperature=0.4,
-                stop=client.formatter.stop_tokens,
+                stop=iteration_stop,
                 stream=True,
             )
 
-            async for chunk in generator:
-                (
-                    response_text,
-                    full_thought,
-                    is_thinking,
-                    thought_tag_found,
-                ) = await self._process_stream_chunk(
-                    chunk,
-                    response_text,
-                    full_thought,
-                    is_thinking,
-                    thought_tag_found,
-                    on_event,
-                )
+            stream_events = (
+                _BackgroundEvents(on_event) if on_event is not None else None
+            )
+            early_tool_call = None
+            try:
+                async for chunk in generator:
+                    # A fence may straddle chunks; re-check its first two backticks.
+                    fence_from = max(0, len(response_text) - 2)
+                    (
+                        response_text,
+                        full_thought,
+                        is_thinking,
+                        thought_tag_found,
+                        scan_offset,
+                        thought_start,
+                    ) = await self._process_stream_chunk(
+                        chunk,
+                        response_text,
+                        full_thought,
+                        is_thinking,
+                        thought_tag_found,
+                        scan_offset,
+                        thought_start,
+                        stream_events,
+                    )
+                    if not is_thinking and response_text.find("```", fence_from) != -1:
+                        early_tool_call = self._parse_streamed_tool_call(
+                            response_text, valid_tool_names
+                        )
+                        if early_tool_call is not None:
+                            # Everything after the tool call's closing fence is
+                            # dropped anyway, so stop generating and dispatch now.
+                            await generator.aclose()
+                            break
+                if stream_events is not None:
+                    await stream_events.drain()
+            finally:
+                # No-op after drain(); on error or cancellation, stop delivering.
+                if stream_events is not None:
+                    stream_events.cancel()
 
             logger.llm_stream_done()
-            full_thought, clean_response = self._finalize_stream_response(response_text)
+            parsed: ToolCall | None
+            if early_tool_call is not None:
+                full_thought, clean_response, parsed, json_end = early_tool_call
+            else:
+                full_thought, clean_response = await _parse_response_text(
+                    self._finalize_stream_response, response_text
+                )
+                parsed, json_end = await _parse_response_text(
+                    parse_tool_call_from_response, clean_response, valid_tool_names
+                )
             if full_thought:
                 logger.thought(full_thought)
 
-            valid_tool_names = {t.name for t in self.tool_registry.list_tools()}
-            parsed, json_end = parse_tool_call_from_response(
-                clean_response, valid_tool_names
-            )
             text_for_slice = clean_response
-            if parsed is None and response_text.strip() != clean_response:
-                parsed, json_end = parse_tool_call_from_response(
-                    response_text.strip(), valid_tool_names
-                )
-                if parsed is not None and json_end >= 0:
-                    text_for_slice = response_text.strip()
+            if parsed is None:
+                stripped_response = response_text.strip()
+                if stripped_response != clean_response:
+                    parsed, json_end = await _parse_response_text(
+                        parse_tool_call_from_response,
+                        stripped_response,
+                        valid_tool_names,
+                    )
+                    if parsed is not None and json_end >= 0:
+                        text_for_slice = stripped_response
 
             if parsed is not None and json_end >= 0:
                 tool_name = get_tool_name(parsed)
@@ -218,6 +488,7 @@ class Agent:
                 assistant_content = text_for_slice[:json_end].strip()
                 if on_event is not None:
                     await on_event("replace_response", assistant_content)
+                tools_called.append(tool_name)
                 await self._execute_tool_turn(
                     tool_name, args, assistant_content, on_event
                 )
@@ -226,17 +497,18 @@ class Agent:
             legacy = parse_legacy_tool_call(clean_response, valid_tool_names)
             if legacy is not None:
                 tool_name, args, assistant_content = legacy
+                tools_called.append(tool_name)
                 await self._execute_tool_turn(
                     tool_name, args, assistant_content, on_event
                 )
                 continue
             else:
-                self.conversation.append(
-                    Message(role="assistant", content=clean_response)
-                )
+                self._append_message("assistant", clean_response)
                 logger.final_response(clean_response)
                 if on_event is not None:
                     await on_event("final_response", clean_response)
+                if plan_key and tools_called:
+                    self._remember_plan(plan_key, tuple(tools_called))
                 out = ChatResult(
                     response=clean_response, pending_confirm=self._pending_confirm
                 )
@@ -249,15 +521,22 @@ class Agent:
             await on_event("final_response", msg)
         return ChatResult(response=msg, pending_confirm=None)
 
+    def _remember_plan(self, plan_key: str, tools: tuple[str, ...]) -> None:
+        self._plan_cache[plan_key] = tools
+        self._plan_cache.move_to_end(plan_key)
+        while len(self._plan_cache) > _PLAN_CACHE_SIZE:
+            self._plan_cache.popitem(last=False)
+
+    def _start_user_turn(self, user_input: str) -> None:
+        logger.user_input(user_input)
+        # Search dedup is per turn: a repeated question later must search again.
+        self._last_search_result = None
+        self._append_message("user", user_input)
+
     def _build_prompt(self, llm_client=None) -> str:
         if llm_client is None:
             llm_client = self.llm_client
-        tz_name = config.user_timezone or "UTC"
-        try:
-            tz: tzinfo = ZoneInfo(tz_name)
-        except Exception:
-            tz = UTC
-            tz_name = "UTC"
+        tz, tz_name = _resolve_timezone(config.user_timezone or "UTC")
         now_utc = datetime.now(UTC)
         now_local = now_utc.astimezone(tz)
         date_line = (
@@ -265,10 +544,15 @@ class Agent:
             "When the user says '5PM' or 'today at 5pm', use that hour in the user's timezone. "
             'For calendar_write create, pass start/end as local time WITHOUT Z (e.g. start="2026-02-04T17:00:00", end="2026-02-04T18:00:00"). Do NOT use UTC/Z unless the user explicitly says UTC.'
         )
-        system_message = fill_date_context(self.system_prompt, date_line)
-        history = [
-            {"role": msg.role, "content": msg.content} for msg in self.conversation[:-1]
-        ]
+        # date_line only changes once a minute; reuse the filled prompt until then.
+        key = (self.system_prompt, date_line)
+        if key != self._system_message_key:
+            self._system_message = fill_date_context(self.system_prompt, date_line)
+            self._system_message_key = key
+        system_message = self._system_message
+        history = list(
+            islice(self._history_dicts, max(0, len(self._history_dicts) - 1))
+        )
         current_input = self.conversation[-1].content if self.conversation else ""
 
         return llm_client.format_prompt(
@@ -277,32 +561,45 @@ class Agent:
             user_message=current_input,
         )
 
+    def _append_message(
+        self, role: str, content: str, is_tool_result: bool = False
+    ) -> None:
+        self.conversation.append(
+            Message(role=role, content=content, is_tool_result=is_tool_result)
+        )
+        self._history_dicts.append({"role": role, "content": content})
+
     def _trim_history(self):
+        # Trimmed once per turn, not via maxlen: a turn's tool results may
+        # temporarily exceed max_history without evicting the user message.
         if len(self.conversation) > self.max_history:
-            self.conversation = self.conversation[-(self.max_history) :]
+            while len(self.conversation) > self.max_history:
+                self.conversation.popleft()
+                self._history_dicts.popleft()
             logger.debug(f"Trimmed history to {len(self.conversation)} messages")
 
     def clear_history(self):
-        self.conversation = []
+        self.conversation.clear()
+        self._history_dicts.clear()
         logger.info("🧹 Conversation cleared")
 
     def _get_last_user_message(self) -> str:
         """Last human user message (not a TOOL_RESULT)."""
         for msg in reversed(self.conversation):
-            if msg.role == "user" and not (msg.content or "").strip().startswith(
-                "TOOL_RESULT("
-            ):
+            if msg.role == "user" and not msg.is_tool_result:
                 return (msg.content or "").strip()
         return ""
 
     def _get_conversation_context(self, max_messages: int = 10) -> str:
         """Recent conversation as a single string so the search orchestrator has the same context as the agent."""
         lines: list[str] = []
-        for msg in self.conversation[-(max_messages):]:
+        start = max(0, len(self.conversation) - max_messages)
+        for msg in islice(self.conversation, start, None):
             role = msg.role.capitalize()
-            content = (msg.content or "").strip()
-            if msg.role == "user" and content.startswith("TOOL_RESULT("):
+            if msg.is_tool_result:
                 content = "[Tool result received.]"
+            else:
+                content = (msg.content or "").strip()
             lines.append(f"{role}: {content}")
         return "\n".join(lines) if lines else ""
 
@@ -313,24 +610,43 @@ class Agent:
         assistant_content: str,
         on_event: Callable[..., Awaitable[object]] | None,
     ) -> None:
-        self.conversation.append(Message(role="assistant", content=assistant_content))
-        if on_event is not None:
-            await on_event("tool_call", {"name": tool_name, "args": args})
+        self._append_message("assistant", assistant_content)
+        # Deliver tool_call while the tool runs; drained before tool_result so the
+        # UI still sees the two events in order, and cancelled if the turn fails.
+        tool_events = _BackgroundEvents(on_event) if on_event is not None else None
+        try:
+            if tool_events is not None:
+                await tool_events("tool_call", {"name": tool_name, "args": args})
+            await self._run_tool(tool_name, args, on_event, tool_events)
+        finally:
+            if tool_events is not None:
+                tool_events.cancel()
+
+    async def _run_tool(
+        self,
+        tool_name: str,
+        args: dict,
+        on_event: Callable[..., Awaitable[object]] | None,
+        tool_events: _BackgroundEvents | None,
+    ) -> None:
         if tool_name == "universal_search":
             user_msg = self._get_last_user_message()
             conversation_context = self._get_conversation_context()
-            # Dedup: same user message = same logical search (conversation_context
-            # grows each turn so keying on it would never hit cache on repeat calls)
-            if self._last_search_user_msg == user_msg and self._last_search_result:
+            # Dedup: within one turn the user message is fixed, so a repeat call is
+            # the same logical search (conversation_context grows between calls).
+            cached_search = self._last_search_result
+            if cached_search:
                 logger.info(
                     "Search dedup: returning cached result for '%s'", user_msg[:60]
                 )
                 result_content = (
-                    self._last_search_result
+                    cached_search
                     + "\n\n(Same results as previous search for this question; answer from these.)"
                 )
                 result_msg = f"TOOL_RESULT({tool_name}): {result_content}"
-                self.conversation.append(Message(role="user", content=result_msg))
+                self._append_message("user", result_msg, is_tool_result=True)
+                if tool_events is not None:
+                    await tool_events.drain()
                 if on_event is not None:
                     await on_event(
                         "tool_result",
@@ -353,24 +669,33 @@ class Agent:
                 metadata={"tool": tool_name},
             ) as run:
                 try:
-                    result = await tool.execute(**args)
+                    # A hung tool must not stall the agent loop indefinitely.
+                    async with asyncio.timeout(tool.timeout_s):
+                        result = await tool.execute(**args)
                     run.end(
                         outputs={
                             "success": result.success,
                             "output_preview": (result.output or result.error)[:500],
                         }
                     )
+                except TimeoutError:
+                    result = ToolResult.fail(
+                        f"{tool_name} timed out after {tool.timeout_s:g}s."
+                    )
+                    # The cancelled tool never reached its own tool_result; close it here.
+                    logger.tool_result(tool_name, 0, False, error_reason=result.error)
+                    run.end(outputs={"success": False, "error": result.error})
                 except Exception as e:
                     result = ToolResult.fail(str(e))
                     run.end(outputs={"success": False, "error": str(e)})
         result_content = result.output if result.success else result.error
-        # Cache search results for dedup (key = user message + conversation context)
-        if tool_name == "universal_search":
-            self._last_search_user_msg = self._get_last_user_message()
-            self._last_search_context = self._get_conversation_context()
+        # Remember the successful search result for dedup within this turn
+        if tool_name == "universal_search" and result.success:
             self._last_search_result = result_content
         result_msg = f"TOOL_RESULT({tool_name}): {result_content}"
-        self.conversation.append(Message(role="user", content=result_msg))
+        self._append_message("user", result_msg, is_tool_result=True)
+        if tool_events is not None:
+            await tool_events.drain()
         if on_event is not None:
             await on_event(
                 "tool_result",
@@ -385,13 +710,14 @@ class Agent:
         )
 
     async def close(self):
-        await self.llm_client.close()
-        for tool in self.tool_registry.list_tools():
-            if hasattr(tool, "close"):
-                if asyncio.iscoroutinefunction(tool.close):
-                    await tool.close()
-                else:
-                    tool.close()
+        # Clients and async tools are independent, so close them concurrently.
+        await asyncio.gather(
+            self.llm_client.close(),
+            *([self.fast_llm_client.close()] if self.fast_llm_client else []),
+            *(close() for close in self._async_tool_closers),
+        )
+        for close in self._sync_tool_closers:
+            close()
         await self._close_closable_resources()
         logger.info("👋 Lilith shutting down")
 
@@ -1,5 +1,13 @@
 """Tool registration, MCP wiring, and capability discovery at startup."""
 
+import asyncio
+import hashlib
+import json
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
 from src.contracts.mcp_search_v1 import (
     CapabilityTier,
     FilterSpec,
@@ -8,6 +16,7 @@ from src.contracts.mcp_search_v1 import (
 from src.core.config import config
 from src.core.logger import logger
 from src.core.prompts import build_system_prompt
+from src.mcp_client.pool import MCPClientLease, get_mcp_pool
 from src.orchestrators.search.backends import (
     CalendarSearchBackend,
     TasksSearchBackend,
@@ -20,46 +29,53 @@ from src.services.google_service import GoogleService
 from src.tools import (
     CalendarReadTool,
     CalendarWriteTool,
+    EmailGetThreadTool,
+    EmailGetTool,
+    EmailsSummarizeTool,
     ExecutePythonTool,
     ReadPagesTool,
     ReadPageTool,
     TasksReadTool,
     TasksWriteTool,
 )
-from src.tools.base import ToolRegistry
+from src.tools.base import Tool, ToolRegistry
 from src.tools.universal_search import UniversalSearchTool
 
+if TYPE_CHECKING:
+    from src.mcp_client.client import MCPClient
+
+McpCall = Callable[[str, dict], Awaitable[dict[str, Any]]]
+
 
-async def _discover_capabilities(
-    mcp_call,
+def _register_discovered_capabilities(
+    caps_data: dict[str, Any],
     connection_key: str,
-    dispatcher: MCPSearchDispatcher,
     registry: CapabilityRegistry,
 ) -> tuple[list[str], dict[str, dict[str, object]]]:
-    """Fetch capabilities from an MCP server and register them.
+    """Register capabilities fetched from an MCP server.
 
     Returns (source names, request routing args map by source).
     """
     try:
-        caps_data = await dispatcher.fetch_capabilities(connection_key, mcp_call)
         if caps_data:
             registry.register_from_dict(caps_data)
-            source_routing_args: dict[str, dict[str, object]] = {}
             if "sources" in caps_data:
-                names: list[str] = []
-                for source_data in caps_data["sources"]:
-                    source_name = source_data["source_name"]
-                    names.append(source_name)
-                    routing_args = source_data.get("request_routing_args")
-                    if isinstance(routing_args, dict) and routing_args:
-                        source_routing_args[source_name] = routing_args
-                return names, source_routing_args
+                sources = caps_data["sources"]
             elif "source_name" in caps_data:
-                source_name = caps_data["source_name"]
-                routing_args = caps_data.get("request_routing_args")
-                if isinstance(routing_args, dict) and routing_args:
-                    source_routing_args[source_name] = routing_args
-                return [source_name], source_routing_args
+                sources = [caps_data]
+            else:
+                sources = []
+            if sources:
+                names = [source_data["source_name"] for source_data in sources]
+                source_routing_args: dict[str, dict[str, object]] = {
+                    source_data["source_name"]: routing_args
+                    for source_data in sources
+                    if isinstance(
+                        routing_args := source_data.get("request_routing_args"), dict
+                    )
+                    and routing_args
+                }
+                return names, source_routing_args
     except Exception as e:
         logger.warning(
             "Failed to discover capabilities from '%s': %s", connection_key, e
@@ -68,14 +84,128 @@ async def _discover_capabilities(
     return [], {}
 
 
-# User-facing labels for direct backends (no MCP discovery)
-_DIRECT_BACKEND_DISPLAY_LABELS: dict[str, str] = {
-    "calendar": "Calendar",
-    "tasks": "Tasks",
-    "web": "Web",
+def _caps_cache_path(connection_key: str, command: str, args: list[str]) -> Path:
+    """Cache file for one server; a changed command, args, or env gets a new file."""
+    launch = json.dumps([command, args, sorted(config.mcp_forward_env.items())])
+    digest = hashlib.blake2b(launch.encode(), digest_size=8).hexdigest()
+    return config.data_dir / "caps_cache" / f"{connection_key}-{digest}.json"
+
+
+def _load_caps_cache(path: Path) -> dict[str, Any] | None:
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("expires_at", 0) < time.time():
+        return None
+    caps_data = cached.get("capabilities")
+    return caps_data if isinstance(caps_data, dict) and caps_data else None
+
+
+def _save_caps_cache(path: Path, caps_data: dict[str, Any], ttl_s: int) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"expires_at": time.time() + ttl_s, "capabilities": caps_data}),
+            encoding="utf-8",
+        )
+    except (OSError, TypeError) as e:
+        logger.warning("Could not cache MCP capabilities to %s: %s", path, e)
+
+
+async def _connect_mcp(
+    connection_key: str,
+    command: str,
+    args: list[str],
+    dispatcher: MCPSearchDispatcher,
+    spawn_slots: asyncio.Semaphore,
+) -> tuple[MCPClientLease, McpCall, dict[str, Any]]:
+    """Lease a pooled MCP client and fetch its capabilities (spawns the server if new).
+
+    With MCP_CAPS_CACHE_TTL_S set, capabilities from a recent start are reused and
+    the server is only spawned on its first call.
+    """
+    lease = get_mcp_pool().acquire(command, args, config.mcp_forward_env)
+    client = lease.client
+
+    async def mcp_call(name: str, args: dict) -> dict[str, Any]:
+        return await client.call_tool(name, args)
+
+    ttl_s = config.mcp_caps_cache_ttl_s
+    cache_path = _caps_cache_path(connection_key, command, args) if ttl_s > 0 else None
+    if cache_path is not None:
+        cached = _load_caps_cache(cache_path)
+        if cached is not None:
+            logger.debug("Using cached capabilities for MCP '%s'", connection_key)
+            return lease, mcp_call, cached
+
+    timeout_s = config.mcp_discovery_timeout_s
+    try:
+        async with spawn_slots, asyncio.timeout(timeout_s):
+            caps_data = await dispatcher.fetch_capabilities(connection_key, mcp_call)
+    except TimeoutError:
+        # Empty capabilities make setup_tools refuse to start for this server.
+        logger.error(
+            "MCP '%s' capability discovery timed out after %ss",
+            connection_key,
+            timeout_s,
+        )
+        caps_data = {}
+    if cache_path is not None and caps_data:
+        _save_caps_cache(cache_path, caps_data, ttl_s)
+    return lease, mcp_call, caps_data
+
+
+async def _release_mcp_leases(leases: list[MCPClientLease]) -> None:
+    """Release MCP clients leased before startup failed."""
+    for result in await asyncio.gather(
+        *(lease.close() for lease in leases), return_exceptions=True
+    ):
+        if isinstance(result, Exception):
+            logger.warning("Failed to close MCP client during startup: %s", result)
+
+
+# Log/error labels for MCP connections
+_MCP_CONNECTION_LABELS: dict[str, str] = {
+    "email": "Email",
+    "browser": "Browser",
+    "whatsapp": "WhatsApp",
 }
 
 
+class _DirectBackendMeta(NamedTuple):
+    """Capability fields for a direct (non-MCP) backend beyond what it reports."""
+
+    display_label: str | None
+    max_limit: int = 50
+    default_limit: int = 10
+    latency_tier: CapabilityTier = CapabilityTier.MEDIUM
+    quality_tier: CapabilityTier = CapabilityTier.MEDIUM
+    cost_tier: CapabilityTier = CapabilityTier.MEDIUM
+
+
+# Per-source metadata for direct backends (no MCP discovery)
+_DIRECT_BACKEND_META: dict[str, _DirectBackendMeta] = {
+    "calendar": _DirectBackendMeta("Calendar"),
+    "tasks": _DirectBackendMeta("Tasks"),
+    "web": _DirectBackendMeta("Web"),
+}
+_DEFAULT_DIRECT_BACKEND_META = _DirectBackendMeta(display_label=None)
+
+# Validated filter specs per backend class. The filters are static, and setup_tools
+# runs once per Agent (the Telegram interface builds one per user).
+_FILTER_SPECS_BY_BACKEND: dict[type, tuple[FilterSpec, ...]] = {}
+
+
+def _filter_specs(backend: Any) -> list[FilterSpec]:
+    backend_cls = type(backend)
+    specs = _FILTER_SPECS_BY_BACKEND.get(backend_cls)
+    if specs is None:
+        specs = tuple(FilterSpec(**f) for f in backend.get_supported_filters())
+        _FILTER_SPECS_BY_BACKEND[backend_cls] = specs
+    return list(specs)
+
+
 def _register_direct_backend_capabilities(
     registry: CapabilityRegistry,
     backends: list,
@@ -83,20 +213,14 @@ def _register_direct_backend_capabilities(
     """Register capabilities for direct (non-MCP) backends."""
     for backend in backends:
         source_name = backend.get_source_name()
+        meta = _DIRECT_BACKEND_META.get(source_name, _DEFAULT_DIRECT_BACKEND_META)
         caps = SearchCapabilities(
             schema_version="1.0",
             source_name=source_name,
             source_class=backend.get_source_class(),
             supported_methods=backend.get_supported_methods(),
-            supported_filters=[
-                FilterSpec(**f) for f in backend.get_supported_filters()
-            ],
-            max_limit=50,
-            default_limit=10,
-            display_label=_DIRECT_BACKEND_DISPLAY_LABELS.get(source_name),
-            latency_tier=CapabilityTier.MEDIUM,
-            quality_tier=CapabilityTier.MEDIUM,
-            cost_tier=CapabilityTier.MEDIUM,
+            supported_filters=_filter_specs(backend),
+            **meta._asdict(),
         )
         registry.register(caps)
 
@@ -108,13 +232,40 @@ async def setup_tools() -> tuple[ToolRegistry, list[object]]:
     (e.g., MCP clients).
     """
     registry = ToolRegistry()
-    google_service = GoogleService()
     closables: list[object] = []
 
     # Capability registry and MCP dispatcher
     capabilities = CapabilityRegistry()
     dispatcher = MCPSearchDispatcher()
 
+    mcp_commands = {
+        "email": (config.mcp_email_command, config.mcp_email_args),
+        "browser": (config.mcp_browser_command, config.mcp_browser_args),
+        "whatsapp": (config.mcp_whatsapp_command, config.mcp_whatsapp_args),
+    }
+    mcp_keys = [key for key, (command, _) in mcp_commands.items() if command]
+    spawn_slots = asyncio.Semaphore(max(1, config.mcp_discovery_parallelism))
+
+    # Google credential loading and MCP server spawn + discovery are independent
+    # I/O; run them concurrently and register results in a fixed order after.
+    google_result, *mcp_results = await asyncio.gather(
+        asyncio.to_thread(GoogleService),
+        *(
+            _connect_mcp(key, *mcp_commands[key], dispatcher, spawn_slots)
+            for key in mcp_keys
+        ),
+        return_exceptions=True,
+    )
+    mcp_connections = [r for r in mcp_results if not isinstance(r, BaseException)]
+    mcp_failed = len(mcp_connections) < len(mcp_results)
+    if isinstance(google_result, BaseException) or mcp_failed:
+        # Don't leave the servers that did come up running.
+        await _release_mcp_leases([lease for lease, _, _ in mcp_connections])
+        raise next(
+            r for r in (google_result, *mcp_results) if isinstance(r, BaseException)
+        )
+    google_service = google_result
+
     # Direct (non-MCP) backends
     direct_backends = [
         WebSearchBackend(),
@@ -125,108 +276,29 @@ async def setup_tools() -> tuple[ToolRegistry, list[object]]:
     # Register direct backend capabilities
     _register_direct_backend_capabilities(capabilities, direct_backends)
 
-    # MCP Email connection
-    mcp_email_client = None
-    if config.mcp_email_command:
-        from src.mcp_client.client import MCPClient
-
-        mcp_email_client = MCPClient(
-            config.mcp_email_command,
-            config.mcp_email_args,
-            env=config.mcp_forward_env,
-        )
-        closables.append(mcp_email_client)
-
-        async def mcp_email_call(name: str, args: dict):
-            return await mcp_email_client.call_tool(name, args)
-
-        # Discover capabilities
-        email_sources, email_routing_args = await _discover_capabilities(
-            mcp_email_call,
-            "email",
-            dispatcher,
-            capabilities,
-        )
-        if not email_sources:
-            raise RuntimeError(
-                "MCP email capability discovery failed; refusing to start with hidden fallback."
-            )
-
-        dispatcher.register_mcp(
-            "email",
-            email_sources,
-            mcp_email_call,
-            request_routing_args=email_routing_args,
-        )
-        logger.info("Email MCP registered: sources=%s", email_sources)
-
-    # MCP Browser connection
-    mcp_browser_client = None
-    if config.mcp_browser_command:
-        from src.mcp_client.client import MCPClient
-
-        mcp_browser_client = MCPClient(
-            config.mcp_browser_command,
-            config.mcp_browser_args,
-            env=config.mcp_forward_env,
-        )
-        closables.append(mcp_browser_client)
-
-        async def mcp_browser_call(name: str, args: dict):
-            return await mcp_browser_client.call_tool(name, args)
-
-        # Discover capabilities
-        browser_sources, browser_routing_args = await _discover_capabilities(
-            mcp_browser_call,
-            "browser",
-            dispatcher,
-            capabilities,
-        )
-        if not browser_sources:
-            raise RuntimeError(
-                "MCP browser capability discovery failed; refusing to start with hidden fallback."
-            )
-
-        dispatcher.register_mcp(
-            "browser",
-            browser_sources,
-            mcp_browser_call,
-            request_routing_args=browser_routing_args,
+    # MCP connections (email, browser, WhatsApp)
+    mcp_clients: dict[str, MCPClient] = {}
+    for key, (lease, mcp_call, caps_data) in zip(mcp_keys, mcp_connections):
+        closables.append(lease)
+        label = _MCP_CONNECTION_LABELS[key]
+        sources, routing_args = _register_discovered_capabilities(
+            caps_data, key, capabilities
         )
-        logger.info("Browser MCP registered: sources=%s", browser_sources)
-
-    # MCP WhatsApp connection
-    if config.mcp_whatsapp_command:
-        from src.mcp_client.client import MCPClient
-
-        mcp_whatsapp_client = MCPClient(
-            config.mcp_whatsapp_command,
-            config.mcp_whatsapp_args,
-            env=config.mcp_forward_env,
-        )
-        closables.append(mcp_whatsapp_client)
-
-        async def mcp_whatsapp_call(name: str, args: dict):
-            return await mcp_whatsapp_client.call_tool(name, args)
-
-        whatsapp_sources, whatsapp_routing_args = await _discover_capabilities(
-            mcp_whatsapp_call,
-            "whatsapp",
-            dispatcher,
-            capabilities,
-        )
-        if not whatsapp_sources:
+        if not sources:
+            await _release_mcp_leases([lease for lease, _, _ in mcp_connections])
             raise RuntimeError(
-                "MCP WhatsApp capability discovery failed; refusing to start with hidden fallback."
+                f"MCP {label} capability discovery failed; refusing to start with hidden fallback."
             )
 
         dispatcher.register_mcp(
-            "whatsapp",
-            whatsapp_sources,
-            mcp_whatsapp_call,
-            request_routing_args=whatsapp_routing_args,
+            key,
+            sources,
+            mcp_call,
+            request_routing_args=routing_args,
         )
-        logger.info("WhatsApp MCP registered: sources=%s", whatsapp_sources)
+        logger.info("%s MCP registered: sources=%s", label, sources)
+        mcp_clients[key] = lease.client
+    mcp_email_client = mcp_clients.get("email")
 
     # Build orchestrator
     orchestrator = UniversalSearchOrchestrator(
@@ -235,42 +307,48 @@ async def setup_tools() -> tuple[ToolRegistry, list[object]]:
         direct_backends=direct_backends,
         max_refinement_rounds=1,
     )
-    registry.register(UniversalSearchTool(orchestrator))
-
-    # Other tools
-    registry.register(ReadPageTool())
-    registry.register(ReadPagesTool())
-    registry.register(ExecutePythonTool())
-    registry.register(CalendarReadTool(google_service))
-    registry.register(CalendarWriteTool(google_service))
-    registry.register(TasksReadTool(google_service))
-    registry.register(TasksWriteTool(google_service))
+    tools: list[Tool] = [
+        UniversalSearchTool(orchestrator),
+        # Other tools
+        ReadPageTool(),
+        ReadPagesTool(),
+        ExecutePythonTool(),
+        CalendarReadTool(google_service),
+        CalendarWriteTool(google_service),
+        TasksReadTool(google_service),
+        TasksWriteTool(google_service),
+    ]
 
     # Email direct tools (get, thread, summarize) via MCP
     if mcp_email_client is not None:
-        from src.tools.email import (
-            EmailGetThreadTool,
-            EmailGetTool,
-            EmailsSummarizeTool,
-        )
-
-        registry.register(EmailGetTool(mcp_email_client))
-        registry.register(EmailGetThreadTool(mcp_email_client))
-        registry.register(EmailsSummarizeTool(mcp_email_client))
+        tools += [
+            EmailGetTool(mcp_email_client),
+            EmailGetThreadTool(mcp_email_client),
+            EmailsSummarizeTool(mcp_email_client),
+        ]
         logger.info("Email tools registered (MCP: %s)", config.mcp_email_command)
     else:
         logger.debug("MCP_EMAIL_COMMAND not set; email tools disabled")
+    registry.register_many(tools)
 
+    sources = capabilities.all_sources()
     logger.info(
         "Bootstrap complete: %s tools, %s sources (%s)",
-        len(registry.list_tools()),
-        len(capabilities.all_sources()),
-        ", ".join(capabilities.all_sources()),
+        registry.count(),
+        len(sources),
+        ", ".join(sources),
     )
 
     return registry, closables
 
 
+def _read_text_if_exists(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8")
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+
+
 def save_system_prompt_for_debug(registry: ToolRegistry) -> str:
     system_prompt = build_system_prompt(
         get_tools_text=registry.get_tools_prompt,
@@ -278,8 +356,14 @@ def save_system_prompt_for_debug(registry: ToolRegistry) -> str:
     )
     system_prompt_path = config.data_dir.resolve() / "system_prompt.md"
     try:
+        if _read_text_if_exists(system_prompt_path) == system_prompt:
+            logger.debug("System prompt unchanged at %s", system_prompt_path)
+            return system_prompt
         config.data_dir.mkdir(parents=True, exist_ok=True)
-        system_prompt_path.write_text(system_prompt, encoding="utf-8")
+        # Write then rename so a crash never leaves a truncated prompt behind.
+        tmp_path = system_prompt_path.with_suffix(".md.tmp")
+        tmp_path.write_text(system_prompt, encoding="utf-8")
+        tmp_path.replace(system_prompt_path)
         logger.info("System prompt saved to %s", system_prompt_path)
     except OSError as e:
         logger.warning("Could not save system prompt to %s: %s", system_prompt_path, e)
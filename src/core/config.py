@@ -1,15 +1,37 @@
 """Configuration from environment variables (.env)."""
 
 import os
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
-@dataclass
+def _csv_env[T](name: str, cast: Callable[[str], T], default: str = "") -> list[T]:
+    """Comma-separated env var as a list, skipping blank entries."""
+    return [
+        cast(item)
+        for raw in os.getenv(name, default).split(",")
+        if (item := raw.strip())
+    ]
+
+
+# Env vars passed through to stdio MCP servers (MCP-side ranking calibration)
+_MCP_FORWARDED_ENV_KEYS = (
+    "LILITH_SCORE_CALIBRATION_PATH",
+    "LILITH_SCORE_WINDOW_SIZE",
+    "LILITH_SCORE_DRIFT_Z",
+    "LILITH_SCORE_RECENCY_HALF_LIFE_DAYS",
+    "LILITH_ENABLE_LEARNED_RANKING",
+    "LILITH_SOURCE_RELIABILITY_PRIORS",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     project_root: Path
     data_dir: Path
@@ -18,6 +40,7 @@ class Config:
     soul_file: Path
     vllm_url: str
     vllm_model: str
+    vllm_fast_model: str
     searxng_url: str
     flaresolverr_url: str
     crawl4ai_url: str
@@ -33,6 +56,7 @@ class Config:
     user_timezone: str
     whisper_url: str
     agent_max_iterations: int
+    agent_plan_cache_enabled: bool
     mcp_email_command: str
     mcp_email_args: list[str]
     mcp_email_account_id: int
@@ -40,9 +64,14 @@ class Config:
     mcp_browser_args: list[str]
     mcp_whatsapp_command: str
     mcp_whatsapp_args: list[str]
+    mcp_caps_cache_ttl_s: int
+    mcp_discovery_timeout_s: float
+    mcp_discovery_parallelism: int
     session_id: str | None
     sessions_dir: Path
-    mcp_forward_env: dict[str, str]
+    external_payload_indent: int | None
+    log_debug_events: bool
+    mcp_forward_env: Mapping[str, str]
 
     @classmethod
     def load(cls) -> "Config":
@@ -53,19 +82,14 @@ class Config:
             path = os.getenv(env_dir) or str(agents_dir / default_subdir)
             return ["--directory", path, "run", "mcp"]
 
-        forwarded_keys = [
-            "LILITH_SCORE_CALIBRATION_PATH",
-            "LILITH_SCORE_WINDOW_SIZE",
-            "LILITH_SCORE_DRIFT_Z",
-            "LILITH_SCORE_RECENCY_HALF_LIFE_DAYS",
-            "LILITH_ENABLE_LEARNED_RANKING",
-            "LILITH_SOURCE_RELIABILITY_PRIORS",
-        ]
-        mcp_forward_env = {
-            key: value
-            for key in forwarded_keys
-            if (value := os.getenv(key)) is not None and value.strip() != ""
-        }
+        # Read-only: every MCP client shares this one mapping.
+        mcp_forward_env = MappingProxyType(
+            {
+                key: value
+                for key in _MCP_FORWARDED_ENV_KEYS
+                if (value := os.getenv(key)) is not None and value.strip() != ""
+            }
+        )
 
         return cls(
             project_root=project_root,
@@ -77,21 +101,14 @@ class Config:
             vllm_model=os.getenv(
                 "VLLM_MODEL", "/models/Meta-Llama-3.1-8B-Instruct-AWQ-INT4"
             ),
+            vllm_fast_model=os.getenv("VLLM_FAST_MODEL", "").strip(),
             searxng_url=os.getenv("SEARXNG_URL", "http://localhost:6002"),
             flaresolverr_url=os.getenv("FLARESOLVERR_URL", "http://localhost:6003"),
             crawl4ai_url=os.getenv("CRAWL4AI_URL", "http://localhost:6004"),
             telegram_token=os.getenv("TELEGRAM_TOKEN", ""),
-            telegram_allowed_users=[
-                int(uid.strip())
-                for uid in os.getenv("TELEGRAM_ALLOWED_USERS", "").split(",")
-                if uid.strip()
-            ],
+            telegram_allowed_users=_csv_env("TELEGRAM_ALLOWED_USERS", int),
             openrouter_api_key=os.getenv("OPENROUTER_API_KEY", ""),
-            openrouter_models=[
-                m.strip()
-                for m in os.getenv("OPENROUTER_MODELS", "openrouter/free").split(",")
-                if m.strip()
-            ],
+            openrouter_models=_csv_env("OPENROUTER_MODELS", str, "openrouter/free"),
             anthropic_api_key=os.getenv("ANTHROPIC_API_KEY", ""),
             google_client_id=os.getenv("GOOGLE_CLIENT_ID", ""),
             google_client_secret=os.getenv("GOOGLE_CLIENT_SECRET", ""),
@@ -104,6 +121,10 @@ class Config:
             user_timezone=os.getenv("USER_TIMEZONE", os.getenv("TZ", "UTC")),
             whisper_url=os.getenv("WHISPER_URL", "http://localhost:6002"),
             agent_max_iterations=int(os.getenv("AGENT_MAX_ITERATIONS", "15")),
+            agent_plan_cache_enabled=os.getenv("AGENT_PLAN_CACHE_ENABLED", "")
+            .strip()
+            .lower()
+            in ("1", "true", "yes"),
             mcp_email_command=os.getenv("MCP_EMAIL_COMMAND", "uv"),
             mcp_email_args=mcp_args("MCP_EMAIL_DIR", "lilith-emails"),
             mcp_email_account_id=int(os.getenv("MCP_EMAIL_ACCOUNT_ID", "1")),
@@ -111,8 +132,15 @@ class Config:
             mcp_browser_args=mcp_args("MCP_BROWSER_DIR", "lilith-browser"),
             mcp_whatsapp_command=os.getenv("MCP_WHATSAPP_COMMAND", "uv"),
             mcp_whatsapp_args=mcp_args("MCP_WHATSAPP_DIR", "lilith-whatsapp"),
+            mcp_caps_cache_ttl_s=int(os.getenv("MCP_CAPS_CACHE_TTL_S", "0")),
+            mcp_discovery_timeout_s=float(os.getenv("MCP_DISCOVERY_TIMEOUT_S", "30")),
+            mcp_discovery_parallelism=int(os.getenv("MCP_DISCOVERY_PARALLELISM", "4")),
             session_id=os.getenv("LILITH_SESSION_ID", "").strip() or None,
             sessions_dir=project_root / "logs" / "sessions",
+            external_payload_indent=int(os.getenv("LOG_EXTERNAL_PAYLOAD_INDENT", "2"))
+            or None,
+            log_debug_events=os.getenv("LOG_DEBUG_EVENTS", "").strip().lower()
+            in ("1", "true", "yes"),
             mcp_forward_env=mcp_forward_env,
         )
 
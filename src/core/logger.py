@@ -1,80 +1,153 @@
 """Structured logging: console, file, and external-call logs."""
 
+import atexit
 import contextvars
-import json
 import logging
 import os
+import queue
+import re
 import shutil
 import sys
 import textwrap
 import threading
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from pathlib import Path
+from typing import Any, NamedTuple, override
+
+import pydantic_core
 
 from src.core.config import config
 
 
 def _format_duration(seconds: float) -> str:
-    if seconds < 0:
-        return "0s"
     if seconds >= 60:
-        m = int(seconds // 60)
-        s = seconds % 60
+        m, s = divmod(seconds, 60)
         if s < 0.05:
-            return f"{m}m"
-        return f"{m}m {s:.0f}s" if s >= 1 else f"{m}m {s:.1f}s"
-    if seconds >= 1:
-        return f"{seconds:.1f}s"
+            return f"{m:.0f}m"
+        return f"{m:.0f}m {s:.0f}s" if s >= 1 else f"{m:.0f}m {s:.1f}s"
     if seconds >= 0.05:
         return f"{seconds:.1f}s"
-    if seconds > 0:
-        return "<0.1s"
-    return "0s"
+    return "<0.1s" if seconds > 0 else "0s"
+
+
+# [^\W_] is exactly str.isalnum(): word characters minus the underscore.
+_ALNUM_RE = re.compile(r"[^\W_]")
+
+
+def _first_alnum(text: str, pos: int) -> int:
+    """Index of the first alphanumeric character at or after pos, else len(text)."""
+    m = _ALNUM_RE.search(text, pos)
+    return m.start() if m else len(text)
 
 
 def _short_reason(reason: str | None, max_len: int = 80) -> str:
     """One-line short reason for console (failed tool)."""
-    if not reason or not reason.strip():
-        return ""
-    s = reason.strip().replace("\n", " ").strip()
+    s = reason.strip() if reason else ""
+    # Ends are already non-whitespace, so replacing inner newlines needs no re-strip.
+    if "\n" in s:
+        s = s.replace("\n", " ")
     return s[:max_len] + "..." if len(s) > max_len else s
 
 
 _TURN_SEP = "  " + "─" * 42 + "  "
+_PREFIX_TOOL = "  │   └ "
+_PREFIX_TURN = "  │ "
+_PREFIX_NONE = ""
 _llm_ctx: contextvars.ContextVar[tuple[float, str] | None] = contextvars.ContextVar(
     "llm_request", default=None
 )
 _log_in_turn: contextvars.ContextVar[bool] = contextvars.ContextVar(
     "log_in_turn", default=False
 )
-_log_in_tool: contextvars.ContextVar[bool] = contextvars.ContextVar(
-    "log_in_tool", default=False
-)
-_log_tool_start: contextvars.ContextVar[float | None] = contextvars.ContextVar(
-    "log_tool_start", default=None
-)
-_log_tool_name: contextvars.ContextVar[str | None] = contextvars.ContextVar(
-    "log_tool_name", default=None
-)
-_log_tool_step: contextvars.ContextVar[str | None] = contextvars.ContextVar(
-    "log_tool_step", default=None
-)
-_log_page_index: contextvars.ContextVar[str | None] = contextvars.ContextVar(
-    "log_page_index", default=None
-)
-_log_page_hint: contextvars.ContextVar[str | None] = contextvars.ContextVar(
-    "log_page_hint", default=None
+
+
+class _ToolLogState(NamedTuple):
+    """Console state for the running tool; one ContextVar read gets all of it."""
+
+    name: str
+    start: float
+    step: str | None = None
+    page_index: str | None = None
+    page_hint: str | None = None
+
+
+# None outside a tool; set by tool_execute, cleared by tool_result.
+_log_tool: contextvars.ContextVar[_ToolLogState | None] = contextvars.ContextVar(
+    "log_tool", default=None
 )
 _prompt_role: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "prompt_role", default=None
 )
 
 _CONVERSATION_TAIL_CHARS = 500
+# How long the writer thread lets a burst of events queue up before one write.
+_LOG_BATCH_WINDOW_S = 0.02
 _DYNAMIC_PROMPT_ROLES = frozenset({"intent", "plan", "refine", "entity_extract"})
 
 
+# (epoch second, its local ISO "YYYY-MM-DDTHH:MM:SS" form); replaced whole, so a
+# racing thread at worst formats the same second twice.
+_timestamp_second: tuple[int, str] = (-1, "")
+
+
+def _iso_timestamp() -> str:
+    """Local ISO timestamp with microseconds; the date/time part is formatted once per second."""
+    global _timestamp_second
+    second, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _timestamp_second
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second).isoformat()
+        _timestamp_second = (second, prefix)
+    return f"{prefix}.{micros:06d}"
+
+
+# (monotonic second, terminal columns); same once-per-second scheme as above.
+_terminal_width_second: tuple[int, int] = (-1, 80)
+
+
+def _terminal_width() -> int:
+    """Terminal columns, re-queried at most once per second."""
+    global _terminal_width_second
+    second = int(time.monotonic())
+    cached_second, columns = _terminal_width_second
+    if second != cached_second:
+        try:
+            columns = shutil.get_terminal_size().columns
+        except OSError:
+            columns = 80
+        _terminal_width_second = (second, columns)
+    return columns
+
+
+_THOUGHT_BORDER = "\033[38;5;239m"
+_THOUGHT_RESET = "\033[0m"
+_THOUGHT_HEADER = f"\n  \033[35m\033[1m🧠 LILITH'S THOUGHT LOG{_THOUGHT_RESET}"
+_THOUGHT_LINE_FMT = (
+    f"  {_THOUGHT_BORDER}│{_THOUGHT_RESET}  \033[38;5;244m\033[3m{{}}{_THOUGHT_RESET}"
+)
+# Reused across thought() calls; only its width changes with the terminal.
+_thought_wrapper = textwrap.TextWrapper()
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter that renders %(asctime)s once per second (datefmt must be whole-second)."""
+
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt=datefmt)
+        self._asctime_second: tuple[int, str] = (-1, "")
+
+    @override
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        second = int(record.created)
+        cached_second, text = self._asctime_second
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._asctime_second = (second, text)
+        return text
+
+
 def _use_color() -> bool:
     if os.environ.get("NO_COLOR"):
         return False
@@ -84,60 +157,76 @@ def _use_color() -> bool:
         return False
 
 
-def _c(role: str) -> str:
-    if not _use_color():
-        return ""
-    # 38;5;N = foreground 256-color
-    codes = {
-        "dim": "\033[38;5;239m",
-        "tool": "\033[38;5;81m",  # cyan for tool/step names
-        "llm_call": "\033[38;5;81m",  # same cyan so "LLM call (tool › step)" is readable
-        "run": "\033[38;5;78m",  # green for Run
-        "done_ok": "\033[38;5;78m",  # green for Done / [ok]
-        "done_fail": "\033[38;5;203m",  # red for [failed]
-        "duration": "\033[38;5;221m",  # yellow for durations
-        "model": "\033[38;5;245m",  # dim gray for model name
-        "reply": "\033[38;5;246m",  # muted for reply preview
-    }
-    return codes.get(role, "")
-
-
-def _reset() -> str:
-    if not _use_color():
-        return ""
-    return "\033[0m"
-
-
-def _tool_label() -> str:
-    name = _log_tool_name.get() or "tool"
-    step = _log_tool_step.get()
-    page_index = _log_page_index.get()
-    if step:
-        return f"{name} › {step}"
-    if page_index:
-        return f"{name} {page_index}"
+# 38;5;N = foreground 256-color
+_COLOR_CODES = {
+    "dim": "\033[38;5;239m",
+    "tool": "\033[38;5;81m",  # cyan for tool/step names
+    "llm_call": "\033[38;5;81m",  # same cyan so "LLM call (tool › step)" is readable
+    "run": "\033[38;5;78m",  # green for Run
+    "done_ok": "\033[38;5;78m",  # green for Done / [ok]
+    "done_fail": "\033[38;5;203m",  # red for [failed]
+    "duration": "\033[38;5;221m",  # yellow for durations
+    "model": "\033[38;5;245m",  # dim gray for model name
+    "reply": "\033[38;5;246m",  # muted for reply preview
+}
+# Decided once at import: stdout's tty-ness and NO_COLOR don't change mid-run.
+_USE_COLOR = _use_color()
+_COLORS = _COLOR_CODES if _USE_COLOR else dict.fromkeys(_COLOR_CODES, "")
+_RESET = "\033[0m" if _USE_COLOR else ""
+# Console scaffolding assembled once, so each line is a short f-string of constants.
+_C_TOOL = _COLORS["tool"]
+_C_LLM_CALL = _COLORS["llm_call"]
+_C_DURATION = _COLORS["duration"]
+_C_MODEL = _COLORS["model"]
+_C_REPLY = _COLORS["reply"]
+_RUN_LABEL = f"{_COLORS['run']}▶ Run{_RESET}"
+_DONE_LABEL = f"{_COLORS['done_ok']}✓ Done{_RESET}"
+_OK_STATUS = f"{_COLORS['done_ok']}[ok]{_RESET}"
+_FAILED_STATUS = f"{_COLORS['done_fail']}[failed]{_RESET}"
+
+
+def _tool_label(tool: _ToolLogState) -> str:
+    name = tool.name or "tool"
+    if tool.step:
+        return f"{name} › {tool.step}"
+    if tool.page_index:
+        return f"{name} {tool.page_index}"
     return name
 
 
-def _page_hint_suffix() -> str:
+def _page_hint_suffix(tool: _ToolLogState) -> str:
     """Short suffix for console when in read_pages (e.g. '  pbs.org')."""
-    hint = _log_page_hint.get()
-    if not hint:
+    if not tool.page_hint:
         return ""
-    return f"  {hint}"
+    return f"  {tool.page_hint}"
+
+
+def _update_tool_state(**changes: str | None) -> None:
+    tool = _log_tool.get()
+    if tool is not None:
+        _log_tool.set(tool._replace(**changes))
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEvent:
     event_type: str
     timestamp: str
     data: dict[str, Any]
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Shallow on purpose: the JSON encoder walks data itself.
+        return {
+            "event_type": self.event_type,
+            "timestamp": self.timestamp,
+            "data": self.data,
+        }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), default=str)
+        return pydantic_core.to_json(self.to_dict(), fallback=str).decode()
+
+    def to_json_line(self) -> bytes:
+        """UTF-8 JSON line for .jsonl files, without a str round-trip."""
+        return pydantic_core.to_json(self.to_dict(), fallback=str) + b"\n"
 
 
 class LilithLogger:
@@ -146,15 +235,29 @@ class LilithLogger:
         self.log_file = config.logs_dir / "agent.log"
         self.external_dir = config.logs_dir / "external"
         self.external_dir.mkdir(exist_ok=True)
-        self._file_lock = threading.Lock()
-        self._log_file_handle = open(self.log_file, "a", encoding="utf-8")
+        # Unbuffered: each batch goes out as one write() of pre-encoded bytes.
+        self._log_file_handle = open(self.log_file, "ab", buffering=0)
+        # log_event only queues lines; a daemon thread writes them in batches.
+        # SimpleQueue.put is lock-free at the Python level and keeps one global order.
+        self._pending_lines: queue.SimpleQueue[bytes] = queue.SimpleQueue()
+        # External-call payload files are written by the same thread, off the turn.
+        self._pending_payloads: queue.SimpleQueue[tuple[Path, bytes]] = (
+            queue.SimpleQueue()
+        )
+        self._write_lock = threading.Lock()
+        self._lines_queued = threading.Event()
+        threading.Thread(
+            target=self._write_loop, name="lilith-log-writer", daemon=True
+        ).start()
+        atexit.register(self.flush)
         self._setup_console_logger()
         self._llm_was_local: bool = False
 
     def _setup_console_logger(self):
         self.console = logging.getLogger("lilith")
-        self.console.setLevel(logging.DEBUG)
-        self._console_formatter = logging.Formatter(
+        # Match the handler: console.debug() then returns before building a LogRecord.
+        self.console.setLevel(logging.INFO)
+        self._console_formatter = _SecondCachedFormatter(
             "%(asctime)s │ %(message)s", datefmt="%H:%M:%S"
         )
         if not self.console.handlers:
@@ -175,9 +278,9 @@ class LilithLogger:
             log.addHandler(handler)
 
     def log_event(self, event: LogEvent) -> None:
-        with self._file_lock:
-            self._log_file_handle.write(event.to_json() + "\n")
-            self._log_file_handle.flush()
+        self._pending_lines.put(event.to_json_line())
+        if not self._lines_queued.is_set():
+            self._lines_queued.set()
         try:
             from src.core.session_recorder import get_session_recorder
 
@@ -185,18 +288,50 @@ class LilithLogger:
         except Exception:
             pass
 
+    def flush(self) -> None:
+        """Write all queued event lines to agent.log and queued payload files."""
+        with self._write_lock:
+            lines: list[bytes] = []
+            try:
+                while True:
+                    lines.append(self._pending_lines.get_nowait())
+            except queue.Empty:
+                pass
+            if lines:
+                data = memoryview(b"".join(lines))
+                # A failed write drops this batch; the writer thread must keep running.
+                try:
+                    while data:
+                        data = data[self._log_file_handle.write(data) :]
+                except OSError as e:
+                    self.console.warning(f"Could not write {self.log_file.name}: {e}")
+            try:
+                while True:
+                    path, payload = self._pending_payloads.get_nowait()
+                    try:
+                        path.write_bytes(payload)
+                    except OSError as e:
+                        self.console.warning(f"Could not write {path.name}: {e}")
+            except queue.Empty:
+                pass
+
+    def _write_loop(self) -> None:
+        while True:
+            self._lines_queued.wait()
+            time.sleep(_LOG_BATCH_WINDOW_S)
+            self._lines_queued.clear()
+            self.flush()
+
     def _timestamp(self) -> str:
-        return datetime.now().isoformat()
+        return _iso_timestamp()
 
     def _prefix(self) -> str:
-        if _log_in_tool.get():
-            return "  │   └ "
-        if _log_in_turn.get():
-            return "  │ "
-        return ""
+        if _log_tool.get() is not None:
+            return _PREFIX_TOOL
+        return _PREFIX_TURN if _log_in_turn.get() else _PREFIX_NONE
 
     def set_tool_step(self, step: str | None) -> None:
-        _log_tool_step.set(step)
+        _update_tool_state(step=step)
 
     def set_prompt_role(self, role: str | None) -> None:
         """Set the role for the next LLM request. main_agent = store metadata only; intent/plan/refine/entity_extract = store full prompt."""
@@ -204,23 +339,24 @@ class LilithLogger:
 
     def set_page_index(self, index: int | None, total: int | None = None) -> None:
         if index is None or total is None or total <= 0:
-            _log_page_index.set(None)
+            _update_tool_state(page_index=None)
         else:
-            _log_page_index.set(f"{index}/{total}")
+            _update_tool_state(page_index=f"{index}/{total}")
 
     def set_page_hint(self, hint: str | None) -> None:
         """Set short page hint (e.g. domain) for read_pages. Cleared in tool_result."""
         if not hint or not hint.strip():
-            _log_page_hint.set(None)
+            _update_tool_state(page_hint=None)
         else:
-            _log_page_hint.set(hint.strip()[:40])
+            _update_tool_state(page_hint=hint.strip()[:40])
 
     def _format_tool_args(self, args: dict) -> str:
         """Shorten args for console so long code/urls don't flood the log."""
         max_val = 72
         out = []
         for k, v in (args or {}).items():
-            s = repr(v)
+            # Only repr what can be shown: a long code/page string is cut first.
+            s = repr(v[:max_val]) if isinstance(v, str) else repr(v)
             if len(s) > max_val:
                 s = s[: max_val - 3].rstrip() + "..."
             out.append(f"{k}={s}")
@@ -284,12 +420,13 @@ class LilithLogger:
             data=data,
         )
         self.log_event(event)
-        if _log_in_tool.get():
-            pre = self._prefix()
-            label = _tool_label()
-            hint = _page_hint_suffix()
+        tool = _log_tool.get()
+        if tool is not None:
+            pre = _PREFIX_TOOL
+            label = _tool_label(tool)
+            hint = _page_hint_suffix(tool)
             self.console.info(
-                f"{pre}{_c('llm_call')}LLM call ({label}){_reset()}{hint}  [{_reset()}{_c('model')}{model}{_reset()}]"
+                f"{pre}{_C_LLM_CALL}LLM call ({label}){_RESET}{hint}  [{_RESET}{_C_MODEL}{model}{_RESET}]"
             )
 
     def llm_response(
@@ -324,22 +461,24 @@ class LilithLogger:
             },
         )
         self.log_event(event)
-        pre = self._prefix()
+        tool = _log_tool.get()
+        if tool is not None:
+            pre = _PREFIX_TOOL
+        else:
+            pre = _PREFIX_TURN if _log_in_turn.get() else _PREFIX_NONE
         dur = _format_duration(elapsed)
-        dur_colored = f"{_c('duration')}{dur}{_reset()}"
-        if _log_in_tool.get():
-            label = _tool_label()
-            hint = _page_hint_suffix()
+        dur_colored = f"{_C_DURATION}{dur}{_RESET}"
+        if tool is not None:
+            label = _tool_label(tool)
+            hint = _page_hint_suffix(tool)
             chars_suffix = f"  {page_chars} chars" if page_chars is not None else ""
             self.console.info(
-                f"{pre}{_c('tool')}{label}{_reset()}{hint}  in {dur_colored}  {chars_suffix}"
+                f"{pre}{_C_TOOL}{label}{_RESET}{hint}  in {dur_colored}  {chars_suffix}"
             )
         elif has_tool_call:
             self.console.info(f"{pre}Agent chose tool: {tool_name}  {dur_colored}")
         else:
-            self.console.info(
-                f"{pre}Agent  {dur_colored}  {_c('model')}[{model}]{_reset()}"
-            )
+            self.console.info(f"{pre}Agent  {dur_colored}  {_C_MODEL}[{model}]{_RESET}")
 
     def llm_stream_done(self):
         pair = _llm_ctx.get()
@@ -352,18 +491,13 @@ class LilithLogger:
             elapsed = 0.0
             model = "?"
         dur = _format_duration(elapsed)
-        dur_colored = f"{_c('duration')}{dur}{_reset()}"
+        dur_colored = f"{_C_DURATION}{dur}{_RESET}"
         self.console.info(
-            f"{self._prefix()}Agent  took {dur_colored}  {_c('model')}[{model}]{_reset()}"
+            f"{self._prefix()}Agent  took {dur_colored}  {_C_MODEL}[{model}]{_RESET}"
         )
 
     def tool_execute(self, tool_name: str, args: dict):
-        _log_tool_start.set(time.monotonic())
-        _log_in_tool.set(True)
-        _log_tool_name.set(tool_name)
-        _log_tool_step.set(None)
-        _log_page_index.set(None)
-        _log_page_hint.set(None)
+        _log_tool.set(_ToolLogState(tool_name, time.monotonic()))
         event = LogEvent(
             event_type="TOOL_EXECUTE",
             timestamp=self._timestamp(),
@@ -372,15 +506,16 @@ class LilithLogger:
         self.log_event(event)
         short_args = self._format_tool_args(args)
         self.console.info(
-            f"{self._prefix()}{_c('run')}▶ Run{_reset()}  {_c('tool')}{tool_name}{_reset()}({short_args})"
+            f"{self._prefix()}{_RUN_LABEL}  {_C_TOOL}{tool_name}{_RESET}({short_args})"
         )
 
     def tool_page_fetched(self, duration_seconds: float):
-        if not _log_in_tool.get():
+        tool = _log_tool.get()
+        if tool is None:
             return
         dur = _format_duration(duration_seconds)
-        hint = _page_hint_suffix()
-        self.console.info(f"{self._prefix()}Fetched  ({dur}){hint}")
+        hint = _page_hint_suffix(tool)
+        self.console.info(f"{_PREFIX_TOOL}Fetched  ({dur}){hint}")
 
     def tool_result(
         self,
@@ -391,16 +526,11 @@ class LilithLogger:
         error_reason: str | None = None,
         result_content: str | None = None,
     ) -> None:
-        # Use tool-level prefix for the Done line before clearing _log_in_tool
+        # Use tool-level prefix for the Done line before clearing _log_tool
         done_prefix = self._prefix()
-        _log_in_tool.set(False)
-        _log_tool_name.set(None)
-        _log_tool_step.set(None)
-        _log_page_index.set(None)
-        _log_page_hint.set(None)
-        start = _log_tool_start.get()
-        _log_tool_start.set(None)
-        elapsed = (time.monotonic() - start) if start is not None else 0.0
+        tool = _log_tool.get()
+        _log_tool.set(None)
+        elapsed = (time.monotonic() - tool.start) if tool is not None else 0.0
         data: dict[str, Any] = {
             "tool": tool_name,
             "result_length": result_length,
@@ -416,17 +546,17 @@ class LilithLogger:
         )
         self.log_event(event)
         dur = _format_duration(elapsed)
-        dur_colored = f"{_c('duration')}{dur}{_reset()}"
+        dur_colored = f"{_C_DURATION}{dur}{_RESET}"
         if success:
             status = "ok"
-            status_str = f"{_c('done_ok')}[ok]{_reset()}"
+            status_str = _OK_STATUS
         else:
             status = (
                 f"failed: {_short_reason(error_reason)}" if error_reason else "failed"
             )
-            status_str = f"{_c('done_fail')}[failed]{_reset()}"
+            status_str = _FAILED_STATUS
         self.console.info(
-            f"{done_prefix}{_c('done_ok')}✓ Done{_reset()}  {_c('tool')}{tool_name}{_reset()}  "
+            f"{done_prefix}{_DONE_LABEL}  {_C_TOOL}{tool_name}{_RESET}  "
             f"total {dur_colored}  {result_length} chars  {status_str}"
         )
         self.console.info("")
@@ -443,15 +573,11 @@ class LilithLogger:
         if len(text) <= preview_len:
             preview = text or "(empty)"
         else:
-            start = 0
-            while start < len(text) and not text[start].isalnum():
-                start += 1
+            start = _first_alnum(text, 0)
             if start < len(text):
                 first_space = text.find(" ", start)
                 if first_space != -1 and first_space - start <= 2:
-                    start = first_space + 1
-                    while start < len(text) and not text[start].isalnum():
-                        start += 1
+                    start = _first_alnum(text, first_space + 1)
             preview = text[start : start + preview_len].rstrip()
             if len(preview) < 20:
                 preview = text[:preview_len].rstrip()
@@ -459,7 +585,7 @@ class LilithLogger:
                 preview = preview + "..."
         length_note = f" ({len(response)} chars)" if len(response) > 80 else ""
         self.console.info(
-            f"{self._prefix()}{_c('reply')}Reply{length_note}: {preview}{_reset()}"
+            f"{self._prefix()}{_C_REPLY}Reply{length_note}: {preview}{_RESET}"
         )
         _log_in_turn.set(False)
         self.console.info(_TURN_SEP)
@@ -480,57 +606,47 @@ class LilithLogger:
             data={"thought": content},
         )
         self.log_event(event)
-        try:
-            terminal_width = shutil.get_terminal_size().columns
-        except OSError:
-            terminal_width = 80
-
-        wrap_width = max(terminal_width - 10, 40)
-        border_color = "\033[38;5;239m"
-        text_color = "\033[38;5;244m\033[3m"
-        header_color = "\033[35m\033[1m"
-        reset = "\033[0m"
-
-        header = f"  {header_color}🧠 LILITH'S THOUGHT LOG{reset}"
-        wrapped_lines = []
+        wrap_width = max(_terminal_width() - 10, 40)
+        _thought_wrapper.width = wrap_width
+        output = [_THOUGHT_HEADER]
         for line in content.split("\n"):
             if not line.strip():
-                wrapped_lines.append("")
+                output.append(_THOUGHT_LINE_FMT.format(""))
                 continue
-            wrapped_lines.extend(textwrap.wrap(line, width=wrap_width))
-        output = [f"\n{header}"]
-        for line in wrapped_lines:
-            output.append(f"  {border_color}│{reset}  {text_color}{line}{reset}")
-        output.append(f"  {border_color}╰{'─' * (wrap_width + 2)}{reset}\n")
+            output.extend(
+                _THOUGHT_LINE_FMT.format(w) for w in _thought_wrapper.wrap(line)
+            )
+        output.append(f"  {_THOUGHT_BORDER}╰{'─' * (wrap_width + 2)}{_THOUGHT_RESET}\n")
 
         self.console.info("\n".join(output))
 
     def external_call(self, provider: str, model: str, full_payload: dict):
         timestamp = self._timestamp()
+        payload_bytes = pydantic_core.to_json(
+            {
+                "timestamp": timestamp,
+                "provider": provider,
+                "model": model,
+                "payload": full_payload,
+            },
+            indent=config.external_payload_indent,
+            fallback=str,
+        )
         event = LogEvent(
             event_type="EXTERNAL_CALL",
             timestamp=timestamp,
             data={
                 "provider": provider,
                 "model": model,
-                "payload_size": len(json.dumps(full_payload)),
+                "payload_size": len(payload_bytes),
             },
         )
         self.log_event(event)
         safe_timestamp = timestamp.replace(":", "-")
         payload_file = self.external_dir / f"{safe_timestamp}_{provider}.json"
-        with open(payload_file, "w") as f:
-            json.dump(
-                {
-                    "timestamp": timestamp,
-                    "provider": provider,
-                    "model": model,
-                    "payload": full_payload,
-                },
-                f,
-                indent=2,
-                default=str,
-            )
+        self._pending_payloads.put((payload_file, payload_bytes))
+        if not self._lines_queued.is_set():
+            self._lines_queued.set()
 
         self.console.warning(
             f"☁️ EXTERNAL: {provider}/{model} → logged to {payload_file.name}"
@@ -582,13 +698,14 @@ class LilithLogger:
         self.console.exception(f"❌ {message}", *args, **kwargs)
 
     def debug(self, message: str, *args, **kwargs):
-        interpolated = (message % args) if args else message
-        event = LogEvent(
-            event_type="DEBUG",
-            timestamp=self._timestamp(),
-            data={"message": interpolated},
-        )
-        self.log_event(event)
+        if config.log_debug_events:
+            interpolated = (message % args) if args else message
+            event = LogEvent(
+                event_type="DEBUG",
+                timestamp=self._timestamp(),
+                data={"message": interpolated},
+            )
+            self.log_event(event)
 
         allowed = {"exc_info", "stack_info", "stacklevel", "extra"}
         log_kwargs = {k: v for k, v in kwargs.items() if k in allowed}
@@ -1,5 +1,7 @@
 """Load and compose prompts from prompts/ (fragment list, substitution, validation)."""
 
+import functools
+import re
 from collections.abc import Callable
 from pathlib import Path
 
@@ -8,24 +10,38 @@ from src.core.logger import logger
 
 REQUIRED_SYSTEM_PLACEHOLDERS = ("{tools}", "{tool_examples}")
 DATE_CONTEXT_PLACEHOLDER = "{date_context}"
+_SYSTEM_PLACEHOLDER_RE = re.compile(
+    "|".join(re.escape(p) for p in REQUIRED_SYSTEM_PLACEHOLDERS)
+)
 
 
 def _prompts_dir() -> Path:
     return config.prompts_dir
 
 
+@functools.lru_cache(maxsize=128)
+def _read_text_at(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text()
+
+
+def _read_prompt_file(path: Path, kind: str) -> str:
+    """Read a prompt file, reusing the last read until its mtime changes."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{kind} not found: {path}") from None
+    return _read_text_at(str(path), mtime_ns)
+
+
 def _read_fragment(name: str) -> str:
     path = _prompts_dir() / name.strip()
-    if not path.exists():
-        raise FileNotFoundError(f"Prompt fragment not found: {path}")
-    return path.read_text().rstrip()
+    return _read_prompt_file(path, "Prompt fragment").rstrip()
 
 
 def load_system_fragments() -> str:
     list_path = _prompts_dir() / "system_fragments.md"
-    if not list_path.exists():
-        raise FileNotFoundError(f"Fragment list not found: {list_path}")
-    lines = [ln.strip() for ln in list_path.read_text().splitlines() if ln.strip()]
+    text = _read_prompt_file(list_path, "Fragment list")
+    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
     parts = []
     for name in lines:
         parts.append(_read_fragment(name))
@@ -35,10 +51,10 @@ def load_system_fragments() -> str:
 def build_system_prompt(
     get_tools_text: Callable[[], str], get_tool_examples_text: Callable[[], str]
 ) -> str:
-    composed = load_system_fragments()
-    composed = composed.replace("{tools}", get_tools_text())
-    examples_block = get_tool_examples_text()
-    composed = composed.replace("{tool_examples}", examples_block)
+    subs = {"{tools}": get_tools_text(), "{tool_examples}": get_tool_examples_text()}
+    composed = _SYSTEM_PLACEHOLDER_RE.sub(
+        lambda m: subs[m.group()], load_system_fragments()
+    )
     for placeholder in REQUIRED_SYSTEM_PLACEHOLDERS:
         if placeholder in composed:
             raise ValueError(
@@ -58,16 +74,11 @@ def fill_date_context(system_prompt: str, date_context: str) -> str:
 
 def load_search_prompt(name: str) -> str:
     path = _prompts_dir() / "search" / f"{name}.md"
-    if not path.exists():
-        raise FileNotFoundError(f"Search prompt not found: {path}")
-    return path.read_text().rstrip()
+    return _read_prompt_file(path, "Search prompt").rstrip()
 
 
 def load_worker_prompt() -> str:
-    path = _prompts_dir() / "worker.md"
-    if not path.exists():
-        raise FileNotFoundError(f"Worker prompt not found: {path}")
-    return path.read_text()
+    return _read_prompt_file(_prompts_dir() / "worker.md", "Worker prompt")
 
 
 def render_worker_prompt(task_description: str, instruction: str, data: str) -> str:
@@ -79,62 +90,55 @@ def render_worker_prompt(task_description: str, instruction: str, data: str) ->
     )
 
 
-_TOOL_CACHE: dict[str, tuple[str, list[str]]] = {}
+# Tool name -> (mtime_ns of its .md file, parsed (description, examples)).
+_TOOL_CACHE: dict[str, tuple[int, tuple[str, list[str]]]] = {}
+# Description runs to the first "## Examples" (if any); examples run to the end.
+_TOOL_MD_RE = re.compile(
+    r"## Description(?P<desc>.*?)(?:## Examples(?P<examples>.*))?\Z", re.S
+)
+# Body of the leading fenced block, up to the closing fence line or the end.
+_CODE_BLOCK_RE = re.compile(r"```[^\n]*\n(?P<body>.*?)(?:^[ \t]*```|\Z)", re.S | re.M)
 
 
 def _parse_tool_md(content: str) -> tuple[str, list[str]]:
     """Parse ## Description and ## Examples; return (description, examples)."""
-    desc = ""
-    examples: list[str] = []
-    if "## Description" in content:
-        parts = content.split("## Description", 1)[1].split("## Examples", 1)
-        desc = (parts[0].strip() or "").strip()
-        if len(parts) > 1:
-            raw = parts[1].strip()
-            if raw.startswith("```"):
-                lines = raw.splitlines()
-                inner: list[str] = []
-                in_block = False
-                for line in lines:
-                    if line.strip().startswith("```"):
-                        if in_block:
-                            break
-                        in_block = True
-                        continue
-                    if in_block and line.strip():
-                        inner.append(line.strip())
-                examples = inner
-            else:
-                for line in raw.splitlines():
-                    line = line.strip()
-                    if line.startswith("- "):
-                        line = line[2:].strip()
-                    if line and not line.startswith("#"):
-                        examples.append(line)
-    else:
-        desc = content.strip()
+    m = _TOOL_MD_RE.search(content)
+    if m is None:
+        return content.strip(), []
+    desc = m["desc"].strip()
+    raw = (m["examples"] or "").strip()
+    if raw.startswith("```"):
+        block = _CODE_BLOCK_RE.match(raw)
+        body = block["body"] if block else ""
+        return desc, [line.strip() for line in body.splitlines() if line.strip()]
+    examples = []
+    for line in raw.splitlines():
+        line = line.strip().removeprefix("- ").strip()
+        if line and not line.startswith("#"):
+            examples.append(line)
     return desc, examples
 
 
-def get_tool_description(tool_name: str) -> str:
-    if tool_name in _TOOL_CACHE:
-        return _TOOL_CACHE[tool_name][0]
+def _load_tool(tool_name: str) -> tuple[str, list[str]]:
+    """Parsed (description, examples) for a tool, reparsed when its file changes.
+
+    A missing file yields ("", []) and is not cached, so adding it later works.
+    """
     path = _prompts_dir() / "tools" / f"{tool_name}.md"
-    if not path.exists():
-        return ""
-    text = path.read_text()
-    desc, examples = _parse_tool_md(text)
-    _TOOL_CACHE[tool_name] = (desc, examples)
-    return desc
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return "", []
+    cached = _TOOL_CACHE.get(tool_name)
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, _parse_tool_md(_read_text_at(str(path), mtime_ns)))
+        _TOOL_CACHE[tool_name] = cached
+    return cached[1]
+
+
+def get_tool_description(tool_name: str) -> str:
+    return _load_tool(tool_name)[0]
 
 
 def get_tool_examples(tool_name: str) -> list[str]:
-    if tool_name in _TOOL_CACHE:
-        return _TOOL_CACHE[tool_name][1]
-    path = _prompts_dir() / "tools" / f"{tool_name}.md"
-    if not path.exists():
-        return []
-    text = path.read_text()
-    desc, examples = _parse_tool_md(text)
-    _TOOL_CACHE[tool_name] = (desc, examples)
-    return examples
+    return _load_tool(tool_name)[1]
@@ -206,8 +206,8 @@ class SessionRecorder:
         """Append one event line to turn_N.jsonl (outside lock)."""
         path = session_dir / f"turn_{turn_n:03d}.jsonl"
         try:
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(event.to_json() + "\n")
+            with open(path, "ab") as f:
+                f.write(event.to_json_line())
         except Exception as e:
             logger.warning("Session recorder: could not append to %s: %s", path, e)
 
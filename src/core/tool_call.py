@@ -2,6 +2,7 @@
 
 import json
 import re
+from collections.abc import Set
 from typing import Annotated, Literal
 
 from pydantic import BaseModel, Field, TypeAdapter, field_validator
@@ -132,10 +133,20 @@ ToolCall = (
 
 _tool_call_adapter: TypeAdapter[ToolCallUnion] = TypeAdapter(ToolCallUnion)
 
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_LEGACY_TOOL_RE = re.compile(
+    r'<(tool|tool_call|[\w_]+)\s+(?:name="([^"]+)"\s*)?(.*?)\s*/>', re.DOTALL
+)
+_LEGACY_QUOTED_ARG_RE = re.compile(r'([\w_]+)="([^"]*)"', re.DOTALL)
+_LEGACY_BARE_ARG_RE = re.compile(r"([\w_]+)=([^\s/\"'>=]+)")
+
 
 def _extract_fenced_json(text: str) -> tuple[str | None, int]:
     """Extract first ```json...``` block; return (content, end_index) or (None, -1)."""
-    match = re.search(r"```(?:json)?\s*(.*?)```", text.strip(), re.DOTALL)
+    if text.count("```") < 2:
+        return None, -1
+    match = _FENCED_JSON_RE.search(text.strip())
     if not match:
         return None, -1
     end_index = match.end()
@@ -144,9 +155,7 @@ def _extract_fenced_json(text: str) -> tuple[str | None, int]:
 
 def _normalize_json(s: str) -> str:
     """Remove trailing commas before } or ] so malformed JSON still parses."""
-    s = re.sub(r",\s*}", "}", s)
-    s = re.sub(r",\s*]", "]", s)
-    return s
+    return _TRAILING_COMMA_RE.sub(r"\1", s)
 
 
 def _coerce_tool_dict(data: dict) -> dict:
@@ -156,7 +165,7 @@ def _coerce_tool_dict(data: dict) -> dict:
 
 def parse_tool_call_from_response(
     response: str,
-    valid_tool_names: set[str],
+    valid_tool_names: Set[str],
 ) -> tuple[ToolCall | None, int]:
     """Parse first ```json...``` block; return (parsed_model, end_index) or (None, -1)."""
     raw, end_index = _extract_fenced_json(response)
@@ -193,13 +202,11 @@ def get_tool_arguments(parsed: ToolCall) -> dict[str, str]:
 
 def parse_legacy_tool_call(
     clean_response: str,
-    valid_tool_names: set[str],
+    valid_tool_names: Set[str],
 ) -> tuple[str, dict[str, str], str] | None:
-    match = re.search(
-        r'<(tool|tool_call|[\w_]+)\s+(?:name="([^"]+)"\s*)?(.*?)\s*/>',
-        clean_response,
-        re.DOTALL,
-    )
+    if "/>" not in clean_response:
+        return None
+    match = _LEGACY_TOOL_RE.search(clean_response)
     if not match:
         return None
     tag_name = match.group(1)
@@ -211,7 +218,7 @@ def parse_legacy_tool_call(
     if tool_name not in valid_tool_names:
         return None
     args = {}
-    for k, v in re.findall(r'([\w_]+)="([^"]*)"', args_str, re.DOTALL):
+    for k, v in _LEGACY_QUOTED_ARG_RE.findall(args_str):
         v_clean = (
             v.replace("\\n", "\n")
             .replace('\\"', '"')
@@ -219,7 +226,7 @@ def parse_legacy_tool_call(
             .replace("\\\\", "\\")
         )
         args[k] = v_clean
-    for k, v in re.findall(r"([\w_]+)=([^\s/\"'>=]+)", args_str):
+    for k, v in _LEGACY_BARE_ARG_RE.findall(args_str):
         if k not in args and v:
             args[k] = v
     tag_end = match.end()
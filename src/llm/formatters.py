@@ -4,6 +4,22 @@ from abc import ABC, abstractmethod
 
 
 class BaseFormatter(ABC):
+    # (system_message, rendered system block) from the last format() call.
+    _system_block_cache: tuple[str, str] | None = None
+
+    def _system_block(self, system_message: str) -> str:
+        """Rendered system block, reused while the system message is unchanged."""
+        cached = self._system_block_cache
+        if cached is not None and cached[0] == system_message:
+            return cached[1]
+        block = self._render_system(system_message)
+        self._system_block_cache = (system_message, block)
+        return block
+
+    @abstractmethod
+    def _render_system(self, system_message: str) -> str:
+        pass
+
     @abstractmethod
     def format(
         self,
@@ -20,28 +36,31 @@ class BaseFormatter(ABC):
 
 
 class Llama3Formatter(BaseFormatter):
+    def _render_system(self, system_message: str) -> str:
+        return f"<|begin_of_text|><|start_header_id|>system<|end_header_id|>\n\n{system_message}<|eot_id|>"
+
     def format(
         self,
         system_message: str,
         conversation: list[dict[str, str]],
         user_message: str | None = None,
     ) -> str:
-        prompt = f"<|begin_of_text|><|start_header_id|>system<|end_header_id|>\n\n{system_message}<|eot_id|>"
+        parts = [self._system_block(system_message)]
 
         for msg in conversation:
             role = msg["role"]
             content = msg["content"]
-            prompt += (
+            parts.append(
                 f"<|start_header_id|>{role}<|end_header_id|>\n\n{content}<|eot_id|>"
             )
 
         if user_message:
-            prompt += (
+            parts.append(
                 f"<|start_header_id|>user<|end_header_id|>\n\n{user_message}<|eot_id|>"
             )
 
-        prompt += "<|start_header_id|>assistant<|end_header_id|>\n\n"
-        return prompt
+        parts.append("<|start_header_id|>assistant<|end_header_id|>\n\n")
+        return "".join(parts)
 
     @property
     def stop_tokens(self) -> list[str]:
@@ -49,23 +68,26 @@ class Llama3Formatter(BaseFormatter):
 
 
 class ChatMLFormatter(BaseFormatter):
+    def _render_system(self, system_message: str) -> str:
+        return f"<|im_start|>system\n{system_message}<|im_end|>\n"
+
     def format(
         self,
         system_message: str,
         conversation: list[dict[str, str]],
         user_message: str | None = None,
     ) -> str:
-        prompt = f"<|im_start|>system\n{system_message}<|im_end|>\n"
+        parts = [self._system_block(system_message)]
         for msg in conversation:
             role = msg["role"]
             content = msg["content"]
-            prompt += f"<|im_start|>{role}\n{content}<|im_end|>\n"
+            parts.append(f"<|im_start|>{role}\n{content}<|im_end|>\n")
 
         if user_message:
-            prompt += f"<|im_start|>user\n{user_message}<|im_end|>\n"
+            parts.append(f"<|im_start|>user\n{user_message}<|im_end|>\n")
 
-        prompt += "<|im_start|>assistant\n"
-        return prompt
+        parts.append("<|im_start|>assistant\n")
+        return "".join(parts)
 
     @property
     def stop_tokens(self) -> list[str]:
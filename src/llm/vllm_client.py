@@ -22,9 +22,9 @@ class LLMResponse:
 
 
 class VLLMClient:
-    def __init__(self):
+    def __init__(self, model: str | None = None):
         self.base_url = config.vllm_url
-        self.model = config.vllm_model
+        self.model = model or config.vllm_model
         self.client = httpx.AsyncClient(timeout=120.0)
         self.formatter = get_formatter(self.model)
 
@@ -170,5 +170,5 @@ class VLLMClient:
         await self.client.aclose()
 
 
-def create_client() -> VLLMClient:
-    return VLLMClient()
+def create_client(model: str | None = None) -> VLLMClient:
+    return VLLMClient(model)
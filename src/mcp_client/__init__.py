@@ -1,5 +1,6 @@
 """MCP client for connecting to MCP servers (e.g. lilith-emails)."""
 
 from src.mcp_client.client import MCPClient
+from src.mcp_client.pool import MCPClientLease, MCPClientPool, get_mcp_pool
 
-__all__ = ["MCPClient"]
+__all__ = ["MCPClient", "MCPClientLease", "MCPClientPool", "get_mcp_pool"]
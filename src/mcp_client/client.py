@@ -3,6 +3,7 @@
 import asyncio
 import json
 import os
+from collections.abc import Mapping
 from contextlib import AsyncExitStack
 from typing import Any
 
@@ -27,7 +28,7 @@ class MCPClient:
         self,
         command: str,
         args: list[str],
-        env: dict[str, str] | None = None,
+        env: Mapping[str, str] | None = None,
     ):
         if not command:
             raise ValueError("MCP command cannot be empty")
@@ -37,26 +38,40 @@ class MCPClient:
         self._session: ClientSession | None = None
         self._exit_stack: AsyncExitStack | None = None
         self._stderr_devnull: Any = None
+        # Pooled clients are shared across Agents: one connect (or close) at a time.
+        self._connect_lock = asyncio.Lock()
 
     async def _ensure_connected(self) -> None:
         if self._session is not None:
             return
+        async with self._connect_lock:
+            if self._session is not None:
+                return
+            try:
+                await self._connect()
+            except BaseException:
+                # Don't leave a half-started server or devnull handle behind.
+                await self._close()
+                raise
+
+    async def _connect(self) -> None:
         self._exit_stack = AsyncExitStack()
         self._stderr_devnull = open(os.devnull, "w")
         server_params = StdioServerParameters(
             command=self._command,
             args=self._args,
-            env=self._env,
+            env=dict(self._env) if self._env is not None else None,
         )
         stdio_transport = await self._exit_stack.enter_async_context(
             stdio_client(server_params, errlog=self._stderr_devnull)
         )
         read_stream, write_stream = stdio_transport
-        self._session = await self._exit_stack.enter_async_context(
+        session = await self._exit_stack.enter_async_context(
             ClientSession(read_stream, write_stream)
         )
-        assert self._session is not None
-        await self._session.initialize()
+        await session.initialize()
+        # Published only once initialized, so the unlocked fast path never sees a half-open session.
+        self._session = session
         logger.info(f"MCP: connected  {self._command}  {' '.join(self._args)}")
 
     async def call_tool(
@@ -103,6 +118,10 @@ class MCPClient:
             return {"success": False, "error": f"MCP call failed: {e!s}"}
 
     async def close(self) -> None:
+        async with self._connect_lock:
+            await self._close()
+
+    async def _close(self) -> None:
         if self._exit_stack is not None:
             try:
                 await self._exit_stack.aclose()
@@ -0,0 +1,69 @@
+"""Process-wide pool of MCP clients, shared by every Agent that launches the same server."""
+
+from collections.abc import Mapping
+
+from src.mcp_client.client import MCPClient
+
+PoolKey = tuple[str, tuple[str, ...], tuple[tuple[str, str], ...]]
+
+
+class MCPClientLease:
+    """One holder's share of a pooled MCPClient; close() releases it back to the pool."""
+
+    def __init__(self, pool: "MCPClientPool", key: PoolKey, client: MCPClient):
+        self._pool = pool
+        self._key = key
+        self.client = client
+        self._released = False
+
+    async def close(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        await self._pool.release(self._key)
+
+
+class MCPClientPool:
+    """Refcounted MCPClients keyed by (command, args, env); the last release closes the server.
+
+    Pool bookkeeping never awaits; the shared client serializes its own
+    connect/close with an asyncio.Lock, since Agents may call it concurrently.
+    """
+
+    def __init__(self):
+        self._clients: dict[PoolKey, MCPClient] = {}
+        self._refcounts: dict[PoolKey, int] = {}
+
+    def acquire(
+        self,
+        command: str,
+        args: list[str],
+        env: Mapping[str, str] | None = None,
+    ) -> MCPClientLease:
+        key: PoolKey = (command, tuple(args), tuple(sorted((env or {}).items())))
+        client = self._clients.get(key)
+        if client is None:
+            client = MCPClient(command, args, env=env)
+            self._clients[key] = client
+        self._refcounts[key] = self._refcounts.get(key, 0) + 1
+        return MCPClientLease(self, key, client)
+
+    async def release(self, key: PoolKey) -> None:
+        remaining = self._refcounts.get(key, 0) - 1
+        if remaining > 0:
+            self._refcounts[key] = remaining
+            return
+        self._refcounts.pop(key, None)
+        client = self._clients.pop(key, None)
+        if client is not None:
+            await client.close()
+
+
+_global_pool: MCPClientPool | None = None
+
+
+def get_mcp_pool() -> MCPClientPool:
+    global _global_pool
+    if _global_pool is None:
+        _global_pool = MCPClientPool()
+    return _global_pool
@@ -4,22 +4,28 @@ Replaces the old per-backend SearchTool subclass pattern.
 One dispatcher handles all MCP servers; each server is called via unified_search.
 """
 
-import json
 import logging
 import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
+
 from src.contracts.mcp_search_v1 import (
     AggregateGroup,
     SearchMode,
     SearchResultV1,
-    SourceClass,
 )
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole page of result rows in one pydantic-core call.
+_result_rows_adapter: TypeAdapter[list[SearchResultV1]] = TypeAdapter(
+    list[SearchResultV1]
+)
+
 
 @dataclass
 class DispatcherResult:
@@ -132,7 +138,7 @@ class MCPSearchDispatcher:
             # May be wrapped in output
             output = result.get("output")
             if isinstance(output, str):
-                return json.loads(output)
+                return from_json(output)
             if isinstance(output, dict):
                 return output
             # Direct dict response
@@ -166,8 +172,9 @@ class MCPSearchDispatcher:
         output = result.get("output")
         if isinstance(output, str):
             try:
-                data = json.loads(output)
-            except json.JSONDecodeError:
+                # Parsed in pydantic-core; repeated row keys are interned.
+                data = from_json(output)
+            except ValueError:
                 logger.warning("Dispatcher: invalid JSON output from '%s'", source)
                 return DispatcherResult(source=source, mode=mode)
         elif isinstance(output, dict):
@@ -189,34 +196,11 @@ class MCPSearchDispatcher:
                     logger.debug("Dispatcher: failed to parse aggregate: %s", e)
 
         raw_results = data.get("results", [])
-        results: list[SearchResultV1] = []
-        if isinstance(raw_results, list):
-            for item in raw_results:
-                if not isinstance(item, dict):
-                    continue
-                try:
-                    results.append(
-                        SearchResultV1(
-                            id=str(item.get("id", "")),
-                            source=item.get("source", source),
-                            source_class=SourceClass(
-                                item.get("source_class", "personal")
-                            ),
-                            title=item.get("title", ""),
-                            snippet=item.get("snippet", ""),
-                            timestamp=item.get("timestamp"),
-                            scores=item.get("scores", {}),
-                            methods_used=item.get("methods_used", []),
-                            metadata=item.get("metadata", {}),
-                            provenance=item.get("provenance"),
-                        )
-                    )
-                except Exception as e:
-                    logger.debug(
-                        "Dispatcher: failed to parse result from '%s': %s",
-                        source,
-                        e,
-                    )
+        results = (
+            self._parse_results(raw_results, source)
+            if isinstance(raw_results, list)
+            else []
+        )
 
         return DispatcherResult(
             results=results,
@@ -225,3 +209,33 @@ class MCPSearchDispatcher:
             mode=response_mode,
             source=source,
         )
+
+    def _parse_results(
+        self, raw_results: list[Any], source: str
+    ) -> list[SearchResultV1]:
+        """Validate result rows as one batch; fall back to per-row parsing on failure.
+
+        The fallback keeps the old behavior of dropping only malformed rows.
+        """
+        rows = [
+            {
+                **item,
+                "id": str(item.get("id", "")),
+                "source": item.get("source", source),
+            }
+            for item in raw_results
+            if isinstance(item, dict)
+        ]
+        try:
+            return _result_rows_adapter.validate_python(rows)
+        except ValidationError:
+            pass
+        results: list[SearchResultV1] = []
+        for row in rows:
+            try:
+                results.append(SearchResultV1.model_validate(row))
+            except ValidationError as e:
+                logger.debug(
+                    "Dispatcher: failed to parse result from '%s': %s", source, e
+                )
+        return results
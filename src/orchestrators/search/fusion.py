@@ -4,6 +4,7 @@ Replaces the old naive concatenation + LLM-only rerank pattern.
 LLM rerank is kept only as an optional tie-breaker for top results.
 """
 
+import heapq
 import logging
 
 from src.contracts.mcp_search_v1 import SearchResultV1, SourceClass
@@ -105,13 +106,12 @@ class WeightedFusionRanker:
         # Deduplicate
         deduped = deduplicate_results(results)
 
-        # Score and sort
-        scored: list[tuple[float, SearchResultV1]] = [
-            (compute_fused_score(r, is_personal_query), r) for r in deduped
-        ]
-        scored.sort(key=lambda x: -x[0])
-
-        ranked = [r for _, r in scored[:max_results]]
+        # Score and keep the top max_results (same order as a stable full sort)
+        ranked = heapq.nlargest(
+            max_results,
+            deduped,
+            key=lambda r: compute_fused_score(r, is_personal_query),
+        )
 
         logger.info(
             "Fusion: %s input -> %s deduped -> %s ranked | personal=%s",
@@ -4,6 +4,7 @@ Handles credential loading, refreshing, and building of API service objects.
 """
 
 import json
+import threading
 from datetime import UTC, datetime, timedelta, tzinfo
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -67,6 +68,63 @@ def _load_credentials(path: Path) -> tuple[Credentials | None, str, str]:
     return creds, default_calendar_id, default_task_list_id
 
 
+# (token path, token file mtime_ns, creds, default calendar id, default task list
+# id). Credentials are safe to share across threads; each GoogleService still
+# builds its own API resources, since their httplib2.Http connection is not.
+_shared_credentials: tuple[Path, int | None, Credentials, str, str] | None = None
+_credentials_lock = threading.Lock()
+
+
+def _token_mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _get_credentials(path: Path) -> tuple[Credentials | None, str, str]:
+    """Valid credentials for path, reloaded (and refreshed) when the file changes."""
+    global _shared_credentials
+    with _credentials_lock:
+        cached = _shared_credentials
+        # A re-auth (google-auth) rewrites the token file; its new mtime forces a reload.
+        if (
+            cached is not None
+            and cached[:2] == (path, _token_mtime_ns(path))
+            and cached[2].valid
+        ):
+            return cached[2], cached[3], cached[4]
+
+        creds, default_calendar_id, default_task_list_id = _load_credentials(path)
+        if creds is not None and not creds.valid:
+            if creds.expired and creds.refresh_token:
+                try:
+                    creds.refresh(Request())
+                    _save_tokens(path, creds, default_calendar_id, default_task_list_id)
+                    logger.info("Google API token refreshed.")
+                except Exception as e:
+                    logger.error(f"Failed to refresh Google API token: {e}")
+                    logger.error(
+                        "Try re-authenticating: python -m src.main google-auth"
+                    )
+                    creds = None
+            else:
+                creds = None
+
+        _shared_credentials = (
+            (
+                path,
+                _token_mtime_ns(path),
+                creds,
+                default_calendar_id,
+                default_task_list_id,
+            )
+            if creds
+            else None
+        )
+        return creds, default_calendar_id, default_task_list_id
+
+
 class GoogleService:
     """A unified service to interact with Google Calendar and Tasks APIs."""
 
@@ -82,30 +140,11 @@ class GoogleService:
         self._reload_credentials()
 
     def _reload_credentials(self) -> None:
-        """Loads credentials from disk and refreshes them if necessary."""
+        """Loads (shared) credentials, refreshing them if necessary, and builds the APIs."""
         self._creds, self.default_calendar_id, self.default_task_list_id = (
-            _load_credentials(self._token_path)
+            _get_credentials(self._token_path)
         )
-
-        if self._creds and self._creds.valid:
-            self._build_api_resources()
-        elif self._creds and self._creds.expired and self._creds.refresh_token:
-            try:
-                self._creds.refresh(Request())
-                _save_tokens(
-                    self._token_path,
-                    self._creds,
-                    self.default_calendar_id,
-                    self.default_task_list_id,
-                )
-                self._build_api_resources()
-                logger.info("Google API token refreshed.")
-            except Exception as e:
-                logger.error(f"Failed to refresh Google API token: {e}")
-                logger.error("Try re-authenticating: python -m src.main google-auth")
-                self._creds = None
-        else:
-            self._creds = None
+        self._build_api_resources()
 
     def _build_api_resources(self):
         """Builds the calendar and tasks API resources if credentials are valid."""
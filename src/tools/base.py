@@ -1,6 +1,7 @@
 """Base Tool class, ToolResult, and ToolRegistry."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 CONFIRM_REQUIRED_PREFIX = "CONFIRM_REQUIRED|"
@@ -9,7 +10,7 @@ CONFIRM_REQUIRED_PREFIX = "CONFIRM_REQUIRED|"
 def parse_pending_confirm(result_content: str) -> dict | None:
     if CONFIRM_REQUIRED_PREFIX not in result_content:
         return None
-    rest = result_content.split(CONFIRM_REQUIRED_PREFIX, 1)[1]
+    rest = result_content.partition(CONFIRM_REQUIRED_PREFIX)[2]
     parts = rest.split("|", 2)
     return {
         "tool": parts[0].strip() if parts else "calendar_write",
@@ -38,6 +39,10 @@ class ToolResult:
 
 
 class Tool(ABC):
+    # Wall-clock budget for one execute() call; the agent fails the call after this.
+    # Tools that make several LLM calls per execute() should set a larger budget.
+    timeout_s: float = 120.0
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -71,11 +76,29 @@ class Tool(ABC):
 class ToolRegistry:
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self._names: frozenset[str] | None = None
 
     def register(self, tool: Tool) -> None:
         if not isinstance(tool, Tool):
             raise TypeError(f"Expected Tool instance, got {type(tool)}")
         self._tools[tool.name] = tool
+        self._names = None
+
+    def register_many(self, tools: Iterable[Tool]) -> None:
+        """Register several tools at once; later tools win on duplicate names."""
+        batch: dict[str, Tool] = {}
+        for tool in tools:
+            if not isinstance(tool, Tool):
+                raise TypeError(f"Expected Tool instance, got {type(tool)}")
+            batch[tool.name] = tool
+        self._tools.update(batch)
+        self._names = None
+
+    def names(self) -> frozenset[str]:
+        """Registered tool names; cached until the next registration."""
+        if self._names is None:
+            self._names = frozenset(self._tools)
+        return self._names
 
     def get(self, name: str) -> Tool | None:
         return self._tools.get(name)
@@ -83,6 +106,9 @@ class ToolRegistry:
     def list_tools(self) -> list[Tool]:
         return list(self._tools.values())
 
+    def count(self) -> int:
+        return len(self._tools)
+
     def get_tools_prompt(self) -> str:
         if not self._tools:
             return "No tools available yet."
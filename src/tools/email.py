@@ -12,6 +12,8 @@ from src.tools.base import Tool, ToolResult
 MCP_EMAIL_GET = "email_get"
 MCP_EMAIL_GET_THREAD = "email_get_thread"
 MCP_EMAILS_SUMMARIZE = "emails_summarize"
+# Summarization runs LLM calls on the MCP server, which can outlast the default budget.
+_SUMMARIZE_TOOL_TIMEOUT = 300.0
 
 
 def _parse_int(s: str | None, default: int) -> int:
@@ -137,6 +139,8 @@ class EmailGetThreadTool(_BaseEmailTool):
 
 
 class EmailsSummarizeTool(_BaseEmailTool):
+    timeout_s = _SUMMARIZE_TOOL_TIMEOUT
+
     @property
     def name(self) -> str:
         return "emails_summarize"
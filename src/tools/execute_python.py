@@ -11,6 +11,9 @@ from src.tools.base import Tool, ToolResult
 
 
 class ExecutePythonTool(Tool):
+    # The sandbox runs in a worker thread: when the agent's timeout fires, the call
+    # is reported as failed but the thread (and the exec in the container) keeps
+    # running until the code finishes.
     def __init__(self):
         self._client = None
         self._container = None
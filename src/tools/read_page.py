@@ -25,6 +25,8 @@ _DEFAULT_UA = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like G
 _HTTPX_TIMEOUT = 15.0
 _CRAWL4AI_TIMEOUT = 60.0
 _FLARESOLVERR_TIMEOUT = 70.0
+# Covers the full fallback chain (httpx, curl_cffi, crawl4ai, FlareSolverr) plus summarization.
+_READ_TOOL_TIMEOUT = 360.0
 _MAX_CONTENT_LEN = 6000
 
 _CF_INDICATORS = (
@@ -282,6 +284,8 @@ async def _summarize_and_return(url: str, topic: str, content: str) -> ToolResul
 
 
 class ReadPageTool(Tool):
+    timeout_s = _READ_TOOL_TIMEOUT
+
     @property
     def name(self) -> str:
         return "read_page"
@@ -345,6 +349,8 @@ def _parse_urls(urls_str: str) -> list[str]:
 class ReadPagesTool(Tool):
     """Batch read multiple URLs in parallel (counts as one agent iteration)."""
 
+    timeout_s = _READ_TOOL_TIMEOUT
+
     @property
     def name(self) -> str:
         return "read_pages"
@@ -5,6 +5,9 @@ from src.orchestrators.search import UniversalSearchOrchestrator
 from src.orchestrators.search.models import UniversalSearchResponse
 from src.tools.base import Tool, ToolResult
 
+# Covers planning, the per-source searches and any refinement rounds (several LLM calls).
+_SEARCH_TOOL_TIMEOUT = 300.0
+
 
 def _format_response(response: UniversalSearchResponse) -> str:
     """Format search results in a compact, LLM-friendly text format."""
@@ -95,6 +98,8 @@ def _format_response(response: UniversalSearchResponse) -> str:
 class UniversalSearchTool(Tool):
     """One search tool. The agent invokes it; full context is injected by the framework."""
 
+    timeout_s = _SEARCH_TOOL_TIMEOUT
+
     def __init__(self, orchestrator: UniversalSearchOrchestrator):
         self._orchestrator = orchestrator
 
@@ -0,0 +1,99 @@
+import dataclasses
+from collections import deque
+from types import SimpleNamespace
+
+import src.core.agent as agent_module
+from src.core.agent import Agent
+from src.tools.base import Tool, ToolRegistry, ToolResult
+
+_TOOL_CALL = '```json\n{"tool": "universal_search"}\n```'
+
+
+class _SearchTool(Tool):
+    @property
+    def name(self) -> str:
+        return "universal_search"
+
+    @property
+    def description(self) -> str:
+        return "stub"
+
+    @property
+    def parameters(self) -> dict[str, str]:
+        return {}
+
+    async def execute(self, **kwargs) -> ToolResult:
+        return ToolResult.ok("sunny")
+
+
+async def _chunks(text: str):
+    yield text
+
+
+class _Client:
+    """Streams the next scripted reply, whichever client the agent picks."""
+
+    def __init__(self, script: deque[str]):
+        self.formatter = SimpleNamespace(stop_tokens=[])
+        self.calls = 0
+        self._script = script
+
+    def format_prompt(self, **kwargs) -> str:
+        return "prompt"
+
+    async def generate(self, **kwargs):
+        self.calls += 1
+        return _chunks(self._script.popleft())
+
+
+def _agent(monkeypatch, *, with_fast_client: bool) -> tuple[Agent, _Client, _Client]:
+    monkeypatch.setattr(
+        agent_module,
+        "config",
+        dataclasses.replace(agent_module.config, agent_plan_cache_enabled=True),
+    )
+    script = deque([_TOOL_CALL, "It is sunny.", _TOOL_CALL, "Still sunny."])
+    main, fast = _Client(script), _Client(script)
+    registry = ToolRegistry()
+    registry.register(_SearchTool())
+    agent = Agent(
+        llm_client=main,
+        system_prompt="",
+        tool_registry=registry,
+        fast_llm_client=fast if with_fast_client else None,
+    )
+    return agent, main, fast
+
+
+async def test_plan_cache_hit_plans_repeat_message_on_fast_client(monkeypatch):
+    agent, main, fast = _agent(monkeypatch, with_fast_client=True)
+    plan_events: list[object] = []
+
+    async def on_event(event_type: str, data: object) -> None:
+        if event_type == "plan_cache":
+            plan_events.append(data)
+
+    await agent.chat("Weather  today?", on_event)
+    await agent.chat("weather today?", on_event)
+
+    assert plan_events == [
+        {"hit": False, "tools": []},
+        {"hit": True, "tools": ["universal_search"]},
+    ]
+    assert main.calls == 1
+    assert fast.calls == 3
+
+
+async def test_plan_cache_is_skipped_without_fast_client(monkeypatch):
+    agent, main, _ = _agent(monkeypatch, with_fast_client=False)
+    events: list[str] = []
+
+    async def on_event(event_type: str, data: object) -> None:
+        events.append(event_type)
+
+    await agent.chat("weather today?", on_event)
+    await agent.chat("weather today?", on_event)
+
+    assert "plan_cache" not in events
+    assert not agent._plan_cache
+    assert main.calls == 4
@@ -0,0 +1,76 @@
+import asyncio
+
+from src.core.agent import Agent
+from src.tools.base import Tool, ToolRegistry, ToolResult
+
+
+class _SearchTool(Tool):
+    def __init__(self, results: list[ToolResult]):
+        self._results = results
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "universal_search"
+
+    @property
+    def description(self) -> str:
+        return "stub"
+
+    @property
+    def parameters(self) -> dict[str, str]:
+        return {}
+
+    async def execute(self, **kwargs) -> ToolResult:
+        self.calls += 1
+        return self._results.pop(0)
+
+
+def _agent(tool: Tool) -> Agent:
+    registry = ToolRegistry()
+    registry.register(tool)
+    return Agent(llm_client=None, system_prompt="", tool_registry=registry)
+
+
+async def test_search_dedup_within_turn_skips_failures():
+    tool = _SearchTool(
+        [ToolResult.fail("universal_search timed out"), ToolResult.ok("inbox: 2 new")]
+    )
+    agent = _agent(tool)
+    agent._start_user_turn("any new emails?")
+
+    await agent._execute_tool_turn("universal_search", {}, "call", None)
+    await agent._execute_tool_turn("universal_search", {}, "call", None)
+    await agent._execute_tool_turn("universal_search", {}, "call", None)
+
+    assert tool.calls == 2
+    assert "Same results as previous search" in agent.conversation[-1].content
+
+
+async def test_search_dedup_resets_on_next_user_turn():
+    tool = _SearchTool([ToolResult.ok("inbox: 2 new"), ToolResult.ok("inbox: 5 new")])
+    agent = _agent(tool)
+
+    agent._start_user_turn("any new emails?")
+    await agent._execute_tool_turn("universal_search", {}, "call", None)
+    agent._start_user_turn("any new emails?")
+    await agent._execute_tool_turn("universal_search", {}, "call", None)
+
+    assert tool.calls == 2
+    assert agent.conversation[-1].content.endswith("inbox: 5 new")
+
+
+async def test_tool_call_event_is_delivered_before_tool_result():
+    events: list[str] = []
+
+    async def on_event(event_type: str, data: object) -> None:
+        if event_type == "tool_call":
+            await asyncio.sleep(0.01)
+        events.append(event_type)
+
+    agent = _agent(_SearchTool([ToolResult.ok("inbox: 2 new")]))
+    agent._start_user_turn("any new emails?")
+    await agent._execute_tool_turn("universal_search", {}, "call", on_event)
+    await agent._execute_tool_turn("universal_search", {}, "call", on_event)
+
+    assert events == ["tool_call", "tool_result", "tool_call", "tool_result"]
@@ -0,0 +1,75 @@
+import asyncio
+
+from src.core.agent import (
+    _STREAM_EVENTS_MAX_PENDING,
+    _advance_thought_state,
+    _BackgroundEvents,
+)
+
+
+def _stream(chunks: list[str]) -> tuple[list[str], bool]:
+    text = ""
+    is_thinking = False
+    tag_found = False
+    thought_start = -1
+    thoughts: list[str] = []
+    for chunk in chunks:
+        scan_offset = len(text)
+        text += chunk
+        is_thinking, tag_found, thought_start, thought = _advance_thought_state(
+            text, scan_offset, is_thinking, tag_found, thought_start
+        )
+        if thought is not None and (not thoughts or thought != thoughts[-1]):
+            thoughts.append(thought)
+    return thoughts, is_thinking
+
+
+def test_tag_split_across_chunks_is_detected():
+    thoughts, is_thinking = _stream(["<th", "ink>plan", " more</thi", "nk>answer"])
+    assert thoughts[0] == "plan"
+    assert thoughts[-1] == "plan more"
+    assert not is_thinking
+
+
+def test_thought_prefix_ends_at_blank_line():
+    thoughts, is_thinking = _stream(["Thought: look", " it up\n", "\nDone"])
+    assert thoughts[-1] == " look it up"
+    assert not is_thinking
+
+
+def test_plain_text_has_no_thought():
+    thoughts, is_thinking = _stream(["Hello", " there"])
+    assert thoughts == []
+    assert not is_thinking
+
+
+async def _emit_tokens(events: _BackgroundEvents, n: int) -> None:
+    for i in range(n):
+        await events("token", i)
+
+
+async def test_background_events_are_bounded_and_cancellable():
+    delivered: list[int] = []
+    gate = asyncio.Event()
+
+    async def slow_consumer(event_type: str, data: object) -> None:
+        await gate.wait()
+        delivered.append(data)
+
+    events = _BackgroundEvents(slow_consumer)
+    producer = asyncio.create_task(_emit_tokens(events, _STREAM_EVENTS_MAX_PENDING * 2))
+    await asyncio.sleep(0)
+    assert not producer.done()
+    assert len(events._pending) <= _STREAM_EVENTS_MAX_PENDING
+
+    gate.set()
+    await producer
+    await events.drain()
+    assert delivered == list(range(_STREAM_EVENTS_MAX_PENDING * 2))
+
+    gate.clear()
+    await events("token", -1)
+    events.cancel()
+    gate.set()
+    await asyncio.sleep(0)
+    assert delivered[-1] != -1
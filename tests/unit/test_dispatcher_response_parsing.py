@@ -0,0 +1,61 @@
+from src.contracts.mcp_search_v1 import SourceClass
+from src.orchestrators.search.dispatcher import MCPSearchDispatcher
+
+
+def test_parse_response_normalizes_rows():
+    dispatcher = MCPSearchDispatcher()
+    result = dispatcher._parse_response(
+        {
+            "success": True,
+            "results": [
+                {"id": 42, "title": "Invoice", "scores": {"structured": 0.9}},
+                {"id": "b", "source": "email_archive", "source_class": "web"},
+            ],
+        },
+        source="email",
+    )
+
+    assert [r.id for r in result.results] == ["42", "b"]
+    assert [r.source for r in result.results] == ["email", "email_archive"]
+    assert result.results[1].source_class == SourceClass.WEB
+
+
+def test_parse_response_drops_only_malformed_rows():
+    dispatcher = MCPSearchDispatcher()
+    result = dispatcher._parse_response(
+        {
+            "success": True,
+            "results": [
+                {"id": "a"},
+                {"id": "b", "source_class": "not-a-class"},
+                "not-a-row",
+                {"id": "c", "scores": {"vector": 0.4}},
+            ],
+        },
+        source="email",
+    )
+
+    assert [r.id for r in result.results] == ["a", "c"]
+
+
+def test_parse_response_decodes_string_output():
+    dispatcher = MCPSearchDispatcher()
+    result = dispatcher._parse_response(
+        {
+            "success": True,
+            "output": '{"count": 1, "results": [{"id": 7, "title": "Receipt"}]}',
+        },
+        source="email",
+    )
+
+    assert result.count == 1
+    assert [r.id for r in result.results] == ["7"]
+
+
+def test_parse_response_rejects_invalid_string_output():
+    dispatcher = MCPSearchDispatcher()
+    result = dispatcher._parse_response(
+        {"success": True, "output": "{not json"}, source="email"
+    )
+
+    assert result.results == []
@@ -0,0 +1,35 @@
+from src.llm.formatters import ChatMLFormatter, Llama3Formatter
+
+
+def test_chatml_format_reuses_system_block_until_message_changes():
+    formatter = ChatMLFormatter()
+    history = [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "yo"},
+    ]
+
+    first = formatter.format("rules v1", history, "next")
+    block = formatter._system_block_cache[1]
+    second = formatter.format("rules v1", history, "next")
+
+    assert first == second
+    assert formatter._system_block_cache[1] is block
+    assert first == (
+        "<|im_start|>system\nrules v1<|im_end|>\n"
+        "<|im_start|>user\nhi<|im_end|>\n"
+        "<|im_start|>assistant\nyo<|im_end|>\n"
+        "<|im_start|>user\nnext<|im_end|>\n"
+        "<|im_start|>assistant\n"
+    )
+
+    changed = formatter.format("rules v2", [], None)
+    assert changed.startswith("<|im_start|>system\nrules v2<|im_end|>\n")
+
+
+def test_llama3_format_renders_system_block():
+    prompt = Llama3Formatter().format("rules", [], "hello")
+
+    assert prompt.startswith(
+        "<|begin_of_text|><|start_header_id|>system<|end_header_id|>\n\nrules<|eot_id|>"
+    )
+    assert prompt.endswith("<|start_header_id|>assistant<|end_header_id|>\n\n")
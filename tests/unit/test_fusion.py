@@ -0,0 +1,38 @@
+from src.contracts.mcp_search_v1 import SearchResultV1, SourceClass
+from src.orchestrators.search.fusion import WeightedFusionRanker, deduplicate_results
+
+
+def _result(rid: str, source: str = "email", **scores: float) -> SearchResultV1:
+    return SearchResultV1(id=rid, source=source, scores=scores)
+
+
+def test_deduplicate_merges_best_score_per_method():
+    merged = deduplicate_results(
+        [
+            _result("a", structured=0.4, vector=0.9),
+            _result("a", structured=0.8),
+            _result("b", vector=0.5),
+        ]
+    )
+
+    assert [r.id for r in merged] == ["a", "b"]
+    assert merged[0].scores == {"structured": 0.8, "vector": 0.9}
+
+
+def test_fuse_and_rank_keeps_top_results_in_stable_order():
+    results = [
+        _result("low", vector=0.1),
+        _result("tie1", structured=0.5),
+        _result("high", structured=0.9),
+        _result("tie2", structured=0.5),
+        SearchResultV1(
+            id="web",
+            source="web",
+            source_class=SourceClass.WEB,
+            scores={"fulltext": 1.0},
+        ),
+    ]
+
+    ranked = WeightedFusionRanker().fuse_and_rank(results, max_results=3)
+
+    assert [r.id for r in ranked] == ["high", "web", "tie1"]
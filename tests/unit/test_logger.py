@@ -0,0 +1,44 @@
+import logging
+
+from src.core.logger import LogEvent, _format_duration, _short_reason, logger
+
+
+def test_format_duration_boundaries():
+    assert _format_duration(-1) == "0s"
+    assert _format_duration(0) == "0s"
+    assert _format_duration(0.01) == "<0.1s"
+    assert _format_duration(0.05) == "0.1s"
+    assert _format_duration(12.34) == "12.3s"
+    assert _format_duration(60.01) == "1m"
+    assert _format_duration(60.5) == "1m 0.5s"
+    assert _format_duration(125) == "2m 5s"
+
+
+def test_format_tool_args_truncates_long_strings():
+    shown = logger._format_tool_args({"code": "x" * 100_000, "n": 3})
+
+    assert shown == f"code='{'x' * 68}..., n=3"
+
+
+def test_short_reason_flattens_and_truncates():
+    assert _short_reason(None) == ""
+    assert _short_reason(" \n ") == ""
+    assert _short_reason("\n  bad\nthing  \n") == "bad thing"
+    assert _short_reason("x" * 100, max_len=10) == "x" * 10 + "..."
+
+
+class _FullDisk:
+    def write(self, data):
+        raise OSError(28, "No space left on device")
+
+
+def test_flush_reports_write_errors_and_keeps_going(monkeypatch, caplog):
+    monkeypatch.setattr(logger, "_log_file_handle", _FullDisk())
+    logger.log_event(LogEvent("TEST", "2026-01-01T00:00:00", {}))
+
+    with caplog.at_level(logging.WARNING, logger="lilith"):
+        logger.flush()
+        logger.log_event(LogEvent("TEST", "2026-01-01T00:00:01", {}))
+        logger.flush()
+
+    assert "No space left on device" in caplog.text
@@ -0,0 +1,88 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+from src.mcp_client import client as client_module
+from src.mcp_client import pool as pool_module
+from src.mcp_client.pool import MCPClientPool
+
+
+class _FakeClient:
+    def __init__(self, command, args, env=None):
+        self.command = command
+        self.args = args
+        self.closed = 0
+
+    async def close(self):
+        self.closed += 1
+
+
+async def test_pool_shares_client_until_last_release(monkeypatch):
+    monkeypatch.setattr(pool_module, "MCPClient", _FakeClient)
+    pool = MCPClientPool()
+
+    first = pool.acquire("uv", ["run", "mcp"], {"B": "2", "A": "1"})
+    second = pool.acquire("uv", ["run", "mcp"], {"A": "1", "B": "2"})
+    other = pool.acquire("uv", ["run", "other"])
+
+    assert first.client is second.client
+    assert other.client is not first.client
+
+    await first.close()
+    await first.close()
+    assert first.client.closed == 0
+
+    await second.close()
+    assert first.client.closed == 1
+
+    replacement = pool.acquire("uv", ["run", "mcp"], {"A": "1", "B": "2"})
+    assert replacement.client is not first.client
+
+
+async def test_concurrent_calls_on_shared_client_spawn_one_server(monkeypatch):
+    spawns = 0
+    exits = 0
+
+    @asynccontextmanager
+    async def fake_stdio_client(params, errlog=None):
+        nonlocal spawns, exits
+        spawns += 1
+        await asyncio.sleep(0)
+        try:
+            yield ("read", "write")
+        finally:
+            exits += 1
+
+    class FakeSession:
+        def __init__(self, read_stream, write_stream):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return None
+
+        async def initialize(self):
+            await asyncio.sleep(0)
+
+        async def call_tool(self, name, arguments):
+            return SimpleNamespace(isError=False, structuredContent={"tool": name})
+
+    monkeypatch.setattr(client_module, "stdio_client", fake_stdio_client)
+    monkeypatch.setattr(client_module, "ClientSession", FakeSession)
+    monkeypatch.setattr(client_module, "StdioServerParameters", SimpleNamespace)
+    pool = MCPClientPool()
+    first = pool.acquire("uv", ["run", "mcp"])
+    second = pool.acquire("uv", ["run", "mcp"])
+
+    results = await asyncio.gather(
+        first.client.call_tool("a", {}), second.client.call_tool("b", {})
+    )
+
+    assert spawns == 1
+    assert [r["tool"] for r in results] == ["a", "b"]
+
+    await first.close()
+    await second.close()
+    assert exits == 1
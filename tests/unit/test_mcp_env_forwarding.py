@@ -1,3 +1,5 @@
+import pytest
+
 from src.core.config import Config
 
 
@@ -24,3 +26,11 @@ def test_mcp_forward_env_omits_empty_values(monkeypatch):
     cfg = Config.load()
     assert "LILITH_SCORE_WINDOW_SIZE" not in cfg.mcp_forward_env
     assert "LILITH_SCORE_DRIFT_Z" not in cfg.mcp_forward_env
+
+
+def test_mcp_forward_env_is_read_only(monkeypatch):
+    monkeypatch.setenv("LILITH_SCORE_WINDOW_SIZE", "10")
+    cfg = Config.load()
+
+    with pytest.raises(TypeError):
+        cfg.mcp_forward_env["LILITH_SCORE_WINDOW_SIZE"] = "20"  # type: ignore[index]
@@ -1,7 +1,12 @@
 import pytest
 from pydantic import ValidationError
 
-from src.contracts.mcp_search_v1 import CapabilityTier, SearchCapabilities
+from src.contracts.mcp_search_v1 import (
+    CapabilityTier,
+    SearchCapabilities,
+    SearchResultV1,
+    UnifiedSearchResponse,
+)
 
 
 def test_search_capabilities_defaults_are_explicit():
@@ -61,3 +66,23 @@ def test_search_capabilities_rejects_empty_alias_hints():
             quality_tier=CapabilityTier.MEDIUM,
             cost_tier=CapabilityTier.MEDIUM,
         )
+
+
+def test_unified_response_keeps_validated_result_instances():
+    result = SearchResultV1(id="a", source="email", metadata={"thread_id": "t1"})
+    response = UnifiedSearchResponse(results=[result])
+
+    assert response.results[0] is result
+    assert response.results[0].metadata is result.metadata
+
+
+def test_search_capabilities_normalizes_alias_hints():
+    caps = SearchCapabilities(
+        source_name="email",
+        supported_methods=["vector"],
+        alias_hints=[" Mail ", "inbox", "MAIL", "Inbox"],
+        latency_tier=CapabilityTier.MEDIUM,
+        quality_tier=CapabilityTier.MEDIUM,
+        cost_tier=CapabilityTier.MEDIUM,
+    )
+    assert caps.alias_hints == ["mail", "inbox"]
@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from src.core import prompts
+
+
+def test_search_prompt_rereads_only_after_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(prompts, "_prompts_dir", lambda: tmp_path)
+    (tmp_path / "search").mkdir()
+    path = tmp_path / "search" / "intent.md"
+    path.write_text("v1\n")
+
+    assert prompts.load_search_prompt("intent") == "v1"
+    assert prompts.load_search_prompt("intent") == "v1"
+
+    path.write_text("v2\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert prompts.load_search_prompt("intent") == "v2"
+
+
+def test_missing_prompt_file_names_the_kind(tmp_path, monkeypatch):
+    monkeypatch.setattr(prompts, "_prompts_dir", lambda: tmp_path)
+
+    with pytest.raises(FileNotFoundError, match="Worker prompt not found"):
+        prompts.load_worker_prompt()
+
+
+def test_build_system_prompt_fills_both_placeholders(tmp_path, monkeypatch):
+    monkeypatch.setattr(prompts, "_prompts_dir", lambda: tmp_path)
+    (tmp_path / "system_fragments.md").write_text("a.md\nb.md\n")
+    (tmp_path / "a.md").write_text("Tools:\n{tools}\n")
+    (tmp_path / "b.md").write_text("Examples:\n{tool_examples}")
+
+    composed = prompts.build_system_prompt(lambda: "- t1", lambda: "ex1")
+
+    assert composed == "Tools:\n- t1\n\nExamples:\nex1"
+
+
+def test_build_system_prompt_rejects_placeholder_from_tool_text(tmp_path, monkeypatch):
+    monkeypatch.setattr(prompts, "_prompts_dir", lambda: tmp_path)
+    (tmp_path / "system_fragments.md").write_text("a.md\n")
+    (tmp_path / "a.md").write_text("{tools}")
+
+    with pytest.raises(ValueError, match="unresolved placeholder"):
+        prompts.build_system_prompt(lambda: "{tool_examples}", lambda: "")
+
+
+def test_parse_tool_md_reads_fenced_and_bulleted_examples():
+    fenced = '## Description\n\nRead it.\n\n## Examples\n\n```json\n{"a": 1}\n\n  {"b": 2}\n```\nafter'
+    bulleted = "## Description\nDo it.\n## Examples\n- one\n# skip\n\n- two"
+
+    assert prompts._parse_tool_md(fenced) == ("Read it.", ['{"a": 1}', '{"b": 2}'])
+    assert prompts._parse_tool_md(bulleted) == ("Do it.", ["one", "two"])
+    assert prompts._parse_tool_md("  plain text  ") == ("plain text", [])
+
+
+def test_tool_docs_are_parsed_once_and_reloaded_on_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(prompts, "_prompts_dir", lambda: tmp_path)
+    monkeypatch.setattr(prompts, "_TOOL_CACHE", {})
+    parsed: list[str] = []
+    parse = prompts._parse_tool_md
+    monkeypatch.setattr(
+        prompts, "_parse_tool_md", lambda text: parsed.append(text) or parse(text)
+    )
+    (tmp_path / "tools").mkdir()
+    path = tmp_path / "tools" / "demo.md"
+    path.write_text("## Description\nDemo.\n## Examples\n- run it")
+
+    assert prompts.get_tool_examples("demo") == ["run it"]
+    assert prompts.get_tool_description("demo") == "Demo."
+    assert len(parsed) == 1
+
+    stat = path.stat()
+    path.write_text("## Description\nRenamed.")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert prompts.get_tool_description("demo") == "Renamed."
+
+    assert prompts.get_tool_description("absent") == ""
+    (tmp_path / "tools" / "absent.md").write_text("late")
+    assert prompts.get_tool_description("absent") == "late"
@@ -0,0 +1,61 @@
+import pytest
+
+from src.tools.base import Tool, ToolRegistry, ToolResult
+
+
+class _StubTool(Tool):
+    def __init__(self, name: str):
+        self._name = name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return "stub"
+
+    @property
+    def parameters(self) -> dict[str, str]:
+        return {}
+
+    async def execute(self, **kwargs) -> ToolResult:
+        return ToolResult.ok("")
+
+
+def test_names_is_cached_until_register():
+    registry = ToolRegistry()
+    registry.register(_StubTool("read_page"))
+
+    names = registry.names()
+    assert names == {"read_page"}
+    assert registry.names() is names
+
+    registry.register(_StubTool("calendar_read"))
+    assert registry.names() == {"read_page", "calendar_read"}
+
+
+def test_register_many_adds_all_tools_and_invalidates_names():
+    registry = ToolRegistry()
+    registry.register(_StubTool("read_page"))
+    names = registry.names()
+
+    registry.register_many([_StubTool("calendar_read"), _StubTool("tasks_read")])
+
+    assert registry.names() is not names
+    assert registry.names() == {"read_page", "calendar_read", "tasks_read"}
+    assert registry.count() == 3
+    assert [t.name for t in registry.list_tools()] == [
+        "read_page",
+        "calendar_read",
+        "tasks_read",
+    ]
+
+
+def test_register_many_rejects_non_tools_without_partial_registration():
+    registry = ToolRegistry()
+
+    with pytest.raises(TypeError):
+        registry.register_many([_StubTool("read_page"), object()])
+
+    assert registry.names() == frozenset()